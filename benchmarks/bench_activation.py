@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Compare cold start with activation of a resident instance.
+
+Needs a running graphical session and a session bus. Runs three launches:
+
+  cold      a fresh process, until the first frame is painted
+  service   first activation of an instance started with
+            --gapplication-service (builds the window)
+  resident  a further launch against that instance, which only re-presents
+            the existing window
+
+Latencies are wall-clock time from spawning the launcher until the primary
+instance records the matching event in its --trace file.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_DIR = ROOT / "usr" / "share" / "biglinux" / "welcome"
+
+
+def count_events(trace_path, name):
+    try:
+        with open(trace_path, encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+    except (OSError, ValueError, KeyError):
+        return 0
+    return sum(1 for event in events if event.get("name") == name)
+
+
+def wait_for_event(trace_path, name, count, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if count_events(trace_path, name) >= count:
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def launch(*args):
+    return subprocess.Popen(
+        [sys.executable, str(APP_DIR / "main.py"), *args],
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def timed_launch(trace_path, event, count, timeout, *args):
+    """Spawn a launcher and return (seconds until event, launcher process)."""
+    start = time.perf_counter()
+    proc = launch(*args)
+    if not wait_for_event(trace_path, event, count, timeout):
+        return None, proc
+    return time.perf_counter() - start, proc
+
+
+def stop(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Resident launches to time."
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=30.0, help="Seconds per launch."
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cold_trace = os.path.join(tmp, "cold.json")
+        cold, proc = timed_launch(
+            cold_trace, "first frame", 1, args.timeout, f"--trace={cold_trace}"
+        )
+        stop(proc)
+
+        service_trace = os.path.join(tmp, "service.json")
+        primary = launch("--gapplication-service", f"--trace={service_trace}")
+        time.sleep(1.0)  # let the service claim its bus name
+        try:
+            first, proc = timed_launch(service_trace, "first frame", 1, args.timeout)
+            proc.wait()
+            resident = []
+            for i in range(1, args.repeat + 1):
+                elapsed, proc = timed_launch(
+                    service_trace, "activate (resident)", i, args.timeout
+                )
+                proc.wait()
+                if elapsed is not None:
+                    resident.append(elapsed)
+        finally:
+            stop(primary)
+
+    def fmt(value):
+        return "timeout" if value is None else f"{value * 1000:8.1f} ms"
+
+    print(f"cold     {fmt(cold)}")
+    print(f"service  {fmt(first)}")
+    if resident:
+        resident.sort()
+        median = resident[len(resident) // 2]
+        print(f"resident {fmt(median)}  (median of {len(resident)})")
+    else:
+        print("resident timeout")
+
+
+if __name__ == "__main__":
+    main()
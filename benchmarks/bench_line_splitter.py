@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Compare the installer-output line splitter with the old bytes buffer.
+
+Feeds multi-megabyte transcripts in pipe-sized chunks through
+install_output.LineSplitter and through the previous ``buf += chunk`` /
+find / slice loop, and prints the throughput of both. Uses synthetic
+pacman-like transcripts unless recorded ones are given with --transcript
+(e.g. captured with ``browser.sh install <pkg> | tee out.log``).
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "usr" / "share" / "biglinux" / "welcome"))
+
+from install_output import LineSplitter  # noqa: E402
+
+
+def legacy_split(buf):
+    """The previous _flush_line_buffer loop, minus the dispatch."""
+    lines = []
+    while b"\n" in buf or b"\r" in buf:
+        idx_n = buf.find(b"\n")
+        idx_r = buf.find(b"\r")
+        is_newline = idx_n >= 0 and (idx_r < 0 or idx_n <= idx_r)
+        if is_newline:
+            lines.append((buf[:idx_n].decode("utf-8", errors="replace"), True))
+            buf = buf[idx_n + 1 :]
+        else:
+            lines.append((buf[:idx_r].decode("utf-8", errors="replace"), False))
+            buf = buf[idx_r + 1 :]
+    return buf, lines
+
+
+def run_legacy(data, chunk_size):
+    buf = b""
+    count = 0
+    for i in range(0, len(data), chunk_size):
+        buf += data[i : i + chunk_size]
+        buf, lines = legacy_split(buf)
+        count += len(lines)
+    return count
+
+
+def run_splitter(data, chunk_size):
+    splitter = LineSplitter()
+    count = 0
+    for i in range(0, len(data), chunk_size):
+        count += len(splitter.feed(data[i : i + chunk_size]))
+    return count
+
+
+def pacman_log(size):
+    """Ordinary newline-terminated transaction output."""
+    lines = [
+        b"(123/456) installing lib32-something-1.2.3-1",
+        b"checking keys in keyring",
+        b"warning: /etc/pacman.conf installed as /etc/pacman.conf.pacnew",
+        b":: Running post-transaction hooks...",
+    ]
+    out = bytearray()
+    i = 0
+    while len(out) < size:
+        out += lines[i % len(lines)] + b"\n"
+        i += 1
+    return bytes(out)
+
+
+def progress_stream(size):
+    """A download redrawn with carriage returns, as in terminal mode."""
+    out = bytearray()
+    pct = 0
+    while len(out) < size:
+        bar = b"#" * (pct % 100) + b"-" * (100 - pct % 100)
+        out += b" firefox-138.0.4-1  45.2 MiB  12.5 MiB/s 00:03 [" + bar
+        out += b"] %d%%\r" % (pct % 100)
+        pct += 1
+    return bytes(out)
+
+
+def long_lines(size, line_length=256 * 1024):
+    """Very long newline-terminated lines (e.g. a build's compiler command)."""
+    line = b"x" * (line_length - 1) + b"\n"
+    return line * max(1, size // line_length)
+
+
+def runaway_line(size):
+    """Output that never ends its line."""
+    return b"y" * size
+
+
+def bench(func, data, chunk_size, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(data, chunk_size)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size-mb", type=float, default=4.0, help="Synthetic transcript size."
+    )
+    parser.add_argument(
+        "--chunk", type=int, default=4096, help="Bytes per simulated read."
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Best of N runs.")
+    parser.add_argument(
+        "--transcript",
+        type=Path,
+        action="append",
+        default=[],
+        help="Recorded installer output to replay (repeatable).",
+    )
+    parser.add_argument(
+        "--skip-legacy",
+        action="store_true",
+        help="Only time LineSplitter (the old loop is quadratic on long lines).",
+    )
+    args = parser.parse_args()
+
+    size = int(args.size_mb * 1024 * 1024)
+    cases = [(path.name, path.read_bytes()) for path in args.transcript]
+    if not cases:
+        cases = [
+            ("pacman log", pacman_log(size)),
+            ("\\r progress", progress_stream(size)),
+            ("long lines", long_lines(size)),
+            ("runaway line", runaway_line(size)),
+        ]
+
+    print(f"{'transcript':<16}{'MiB':>7}{'legacy':>14}{'splitter':>14}")
+    for name, data in cases:
+        mib = len(data) / (1024 * 1024)
+        new = bench(run_splitter, data, args.chunk, args.rounds)
+        if args.skip_legacy:
+            old_text = "-"
+        else:
+            old = bench(run_legacy, data, args.chunk, args.rounds)
+            old_text = f"{mib / old:8.1f} MiB/s"
+        print(f"{name:<16}{mib:>7.1f}{old_text:>14}{mib / new:>9.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
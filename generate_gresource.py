@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+# Must match RESOURCE_PREFIX in utils.py
+PREFIX = "/org/biglinux/welcome"
+
+# Files bundled from the app directory (image/ is added recursively)
+FILES = ["style.css", "pages.yaml", "install_rules.json"]
+IMAGE_SUFFIXES = {".svg", ".png"}
+
+
+def collect_files(app_dir):
+    """Return the bundled files as sorted paths relative to app_dir."""
+    files = [name for name in FILES if (app_dir / name).is_file()]
+    for path in sorted((app_dir / "image").rglob("*")):
+        if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES:
+            files.append(path.relative_to(app_dir).as_posix())
+    return files
+
+
+def build_manifest(files):
+    """Build the GResource XML manifest for the given relative paths."""
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        "<gresources>",
+        f'  <gresource prefix="{PREFIX}">',
+    ]
+    for name in files:
+        lines.append(f"    <file>{escape(name)}</file>")
+    lines += ["  </gresource>", "</gresources>", ""]
+    return "\n".join(lines)
+
+
+def main():
+    """Compile the app's CSS, catalog and images into one .gresource file."""
+    parser = argparse.ArgumentParser(
+        description="Bundle the app's CSS, data files and image/ into a GResource."
+    )
+    parser.add_argument("app_dir", type=Path, help="Path to the application directory.")
+    parser.add_argument(
+        "--target",
+        type=Path,
+        help="Output file (default: <app_dir>/welcome.gresource).",
+    )
+    args = parser.parse_args()
+
+    app_dir: Path = args.app_dir.resolve()
+    target: Path = args.target or app_dir / "welcome.gresource"
+
+    files = collect_files(app_dir)
+    print(f"Bundling {len(files)} files into: {target}")
+
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".gresource.xml", encoding="utf-8"
+    ) as manifest:
+        manifest.write(build_manifest(files))
+        manifest.flush()
+        try:
+            subprocess.run(
+                [
+                    "glib-compile-resources",
+                    f"--sourcedir={app_dir}",
+                    f"--target={target}",
+                    manifest.name,
+                ],
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Error compiling resources: {e}")
+            sys.exit(1)
+
+    print("Done.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Tests for BigLinux Welcome — browser registry."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+APP_DIR = str(
+    Path(__file__).resolve().parent.parent / "usr" / "share" / "biglinux" / "welcome"
+)
+sys.path.insert(0, APP_DIR)
+
+from browsers import (  # noqa: E402
+    BrowserRegistry,
+    BrowserState,
+    Variant,
+    expand_check,
+    load_default_snapshot,
+    save_default_snapshot,
+)
+from catalog import load_catalog  # noqa: E402
+
+ENTRIES = [
+    {
+        "label": "Firefox",
+        "package": "firefox",
+        "variants": [
+            {"check": "/usr/bin/firefox", "desktop": "firefox.desktop"},
+            {
+                "check": "/var/lib/flatpak/app/org.mozilla.firefox",
+                "desktop": "org.mozilla.firefox.desktop",
+            },
+        ],
+    },
+    {
+        "label": "Falkon",
+        "package": "falkon",
+        "variants": [
+            {"check": "/usr/bin/falkon", "desktop": "org.kde.falkon.desktop"},
+            {
+                "check": "/var/lib/flatpak/app/org.kde.falkon",
+                "desktop": "org.kde.falkon.desktop",
+            },
+        ],
+    },
+]
+
+
+class TestBrowserRegistry(unittest.TestCase):
+    """Tests for browsers.BrowserRegistry."""
+
+    def setUp(self):
+        self.registry = BrowserRegistry(ENTRIES)
+        self.firefox = self.registry.get("firefox")
+        self.falkon = self.registry.get("falkon")
+
+    def test_entries_are_typed(self):
+        self.assertEqual(len(self.registry), 2)
+        self.assertEqual(self.firefox.label, "Firefox")
+        self.assertIs(self.firefox.entry, ENTRIES[0])
+        self.assertEqual(
+            self.firefox.variants[0], Variant("/usr/bin/firefox", "firefox.desktop")
+        )
+
+    def test_lookups(self):
+        self.assertIsNone(self.registry.get("opera"))
+        for_desktop = self.registry.for_desktop
+        self.assertIs(for_desktop("org.mozilla.firefox.desktop"), self.firefox)
+        self.assertIs(for_desktop("org.kde.falkon.desktop"), self.falkon)
+        browser, variant = self.registry.for_check("/usr/bin/falkon")
+        self.assertIs(browser, self.falkon)
+        self.assertEqual(variant.desktop, "org.kde.falkon.desktop")
+        # Both flatpaks also count as per-user installations
+        self.assertEqual(len(self.registry.check_paths()), 6)
+
+    def test_browsers_for_checks(self):
+        found = self.registry.browsers_for_checks(
+            ["/usr/bin/firefox", "/var/lib/flatpak/app/org.mozilla.firefox", "/x"]
+        )
+        self.assertEqual(found, {self.firefox})
+
+    def test_update_installed_prefers_first_variant(self):
+        present = {"/usr/bin/firefox", "/var/lib/flatpak/app/org.mozilla.firefox"}
+        self.registry.update_installed(present.__contains__)
+        self.assertEqual(self.firefox.desktop, "firefox.desktop")
+        self.assertFalse(self.falkon.installed)
+        self.assertIsNone(self.falkon.desktop)
+
+    def test_update_installed_subset(self):
+        self.registry.update_installed(lambda _path: True, [self.falkon])
+        self.assertTrue(self.falkon.installed)
+        self.assertFalse(self.firefox.installed)
+
+    def test_default(self):
+        self.registry.update_installed({"/usr/bin/firefox"}.__contains__)
+        self.assertIsNone(self.registry.default)
+
+        self.registry.default_desktop = "firefox.desktop"
+        self.assertIs(self.registry.default, self.firefox)
+        self.assertTrue(self.registry.is_default(self.firefox))
+        self.assertFalse(self.registry.is_default(self.falkon))
+
+        # A default naming a variant that isn't the installed one
+        self.registry.default_desktop = "org.mozilla.firefox.desktop"
+        self.assertIsNone(self.registry.default)
+        self.assertFalse(self.registry.is_default(self.firefox))
+
+    def test_empty_default_matches_nothing(self):
+        entries = [{"package": "x", "variants": [{"check": "/bin/sh"}]}]
+        registry = BrowserRegistry(entries)
+        registry.update_installed(lambda _path: True)
+        registry.default_desktop = ""
+        self.assertFalse(registry.is_default(registry.get("x")))
+
+    def test_changed_states(self):
+        applied = self.registry.states()
+        self.assertEqual(self.registry.changed_states(applied), {})
+
+        self.registry.update_installed({"/usr/bin/firefox"}.__contains__)
+        self.registry.default_desktop = "firefox.desktop"
+        self.assertEqual(
+            self.registry.changed_states(applied),
+            {self.firefox: BrowserState(True, "firefox.desktop", True)},
+        )
+
+        applied = self.registry.states()
+        self.registry.default_desktop = "org.kde.falkon.desktop"
+        self.assertEqual(
+            self.registry.changed_states(applied),
+            {self.firefox: BrowserState(True, "firefox.desktop", False)},
+        )
+
+    def test_user_flatpak_variant(self):
+        with patch.dict(os.environ, {"XDG_DATA_HOME": "/home/u/.local/share"}):
+            registry = BrowserRegistry(ENTRIES)
+        user_check = "/home/u/.local/share/flatpak/app/org.mozilla.firefox"
+        browser, variant = registry.for_check(user_check)
+        self.assertIs(browser, registry.get("firefox"))
+        self.assertEqual(variant.desktop, "org.mozilla.firefox.desktop")
+
+        registry.update_installed({user_check}.__contains__)
+        self.assertEqual(browser.desktop, "org.mozilla.firefox.desktop")
+
+
+class TestExpandCheck(unittest.TestCase):
+    """Tests for browsers.expand_check."""
+
+    def test_plain_path(self):
+        self.assertEqual(expand_check("/usr/bin/firefox"), ["/usr/bin/firefox"])
+        self.assertEqual(expand_check(""), [""])
+
+    def test_alternate_roots(self):
+        with patch.dict(os.environ, {"XDG_DATA_HOME": "/home/u/.local/share"}):
+            self.assertEqual(
+                expand_check("/var/lib/flatpak/app/org.mozilla.firefox"),
+                [
+                    "/var/lib/flatpak/app/org.mozilla.firefox",
+                    "/home/u/.local/share/flatpak/app/org.mozilla.firefox",
+                ],
+            )
+        self.assertEqual(
+            expand_check("/snap/bin/firefox"),
+            ["/snap/bin/firefox", "/var/lib/snapd/snap/bin/firefox"],
+        )
+
+    def test_home_directory(self):
+        with patch.dict(os.environ, {"HOME": "/home/u"}):
+            self.assertEqual(
+                expand_check("~/Applications/Firefox*.AppImage"),
+                ["/home/u/Applications/Firefox*.AppImage"],
+            )
+
+
+class TestDefaultSnapshot(unittest.TestCase):
+    """Tests for the persisted default browser."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ, {"XDG_CACHE_HOME": self._tmp.name})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def test_missing(self):
+        self.assertIsNone(load_default_snapshot())
+
+    def test_round_trip(self):
+        self.assertTrue(save_default_snapshot("firefox.desktop"))
+        self.assertEqual(load_default_snapshot(), "firefox.desktop")
+        self.assertTrue(save_default_snapshot(None))
+        self.assertIsNone(load_default_snapshot())
+
+    def test_ignores_other_versions_and_garbage(self):
+        path = os.path.join(self._tmp.name, "snapshot.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"version": 0, "default_desktop": "firefox.desktop"}')
+        self.assertIsNone(load_default_snapshot(path))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        self.assertIsNone(load_default_snapshot(path))
+
+
+class TestCatalogBrowsers(unittest.TestCase):
+    """The shipped pages.yaml builds a consistent registry."""
+
+    def test_packages_are_unique(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.dict(os.environ, {"XDG_CACHE_HOME": tmp}):
+                pages = load_catalog(os.path.join(APP_DIR, "pages.yaml"))
+        browser_pages = [p for p in pages if p.get("page_type") == "browsers"]
+        self.assertTrue(browser_pages)
+        for page in browser_pages:
+            registry = BrowserRegistry(page["actions"])
+            packages = [b.package for b in registry]
+            self.assertEqual(len(packages), len(set(packages)))
+            for browser in registry:
+                self.assertTrue(browser.variants, browser.package)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Tests for BigLinux Welcome — pages.yaml catalog cache."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+APP_DIR = str(
+    Path(__file__).resolve().parent.parent / "usr" / "share" / "biglinux" / "welcome"
+)
+sys.path.insert(0, APP_DIR)
+
+import catalog  # noqa: E402
+
+PAGES_YAML = os.path.join(APP_DIR, "pages.yaml")
+
+
+class TestValidate(unittest.TestCase):
+    """Tests for catalog.validate."""
+
+    def test_rejects_non_list(self):
+        self.assertIsNone(catalog.validate({"title": "x"}))
+        self.assertIsNone(catalog.validate(None))
+
+    def test_drops_malformed_entries(self):
+        data = [
+            {"title": "A", "actions": [{"label": "ok"}, "bad"]},
+            "bad",
+            {"title": "B"},
+        ]
+        self.assertEqual(
+            catalog.validate(data),
+            [
+                {"title": "A", "actions": [{"label": "ok"}]},
+                {"title": "B", "actions": []},
+            ],
+        )
+
+
+class TestLoadCatalog(unittest.TestCase):
+    """Tests for catalog.load_catalog cache behaviour."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+        self.env = patch.dict(os.environ, {"XDG_CACHE_HOME": self.tmp})
+        self.env.start()
+        self.sys_cache = patch.object(
+            catalog, "SYSTEM_CACHE_DIR", os.path.join(self.tmp, "system")
+        )
+        self.sys_cache.start()
+        self.source = os.path.join(self.tmp, "pages.yaml")
+        with open(self.source, "w", encoding="utf-8") as f:
+            f.write('- title: "One"\n  actions:\n    - label: "A"\n')
+
+    def tearDown(self):
+        self.sys_cache.stop()
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def _cache_file(self):
+        return os.path.join(catalog.user_cache_dir(), catalog.CACHE_NAME)
+
+    def test_miss_parses_and_writes_cache(self):
+        pages = catalog.load_catalog(self.source)
+        self.assertEqual(pages, [{"title": "One", "actions": [{"label": "A"}]}])
+        self.assertTrue(os.path.exists(self._cache_file()))
+
+    def test_hit_skips_yaml(self):
+        catalog.load_catalog(self.source)
+        with patch.object(catalog, "_parse", side_effect=AssertionError("parsed")):
+            pages = catalog.load_catalog(self.source)
+        self.assertEqual(pages[0]["title"], "One")
+
+    def test_content_change_invalidates_cache(self):
+        catalog.load_catalog(self.source)
+        stat = os.stat(self.source)
+        with open(self.source, "w", encoding="utf-8") as f:
+            f.write('- title: "Two"\n')
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        pages = catalog.load_catalog(self.source)
+        self.assertEqual(pages[0]["title"], "Two")
+
+    def test_corrupt_cache_falls_back_to_yaml(self):
+        catalog.load_catalog(self.source)
+        with open(self._cache_file(), "w", encoding="utf-8") as f:
+            f.write("{not json")
+        pages = catalog.load_catalog(self.source)
+        self.assertEqual(pages[0]["title"], "One")
+        with open(self._cache_file(), encoding="utf-8") as f:
+            self.assertIn("key", json.load(f))
+
+    def test_system_cache_is_used(self):
+        self.assertTrue(catalog.compile_system_cache(self.source))
+        with patch.object(catalog, "_parse", side_effect=AssertionError("parsed")):
+            pages = catalog.load_catalog(self.source)
+        self.assertEqual(pages[0]["title"], "One")
+
+    def test_system_cache_uses_bundle_mtime(self):
+        bundle = os.path.join(self.tmp, "welcome.gresource")
+        with open(bundle, "wb") as f:
+            f.write(b"GVariant")
+        os.utime(bundle, ns=(0, 1_000_000_000))
+        self.assertTrue(catalog.compile_system_cache(self.source, bundle))
+        with open(self.source, "rb") as f:
+            data = f.read()
+        with patch.object(catalog, "_parse", side_effect=AssertionError("parsed")):
+            pages = catalog.load_catalog_data(data, 1_000_000_000)
+        self.assertEqual(pages[0]["title"], "One")
+
+    def test_missing_file(self):
+        self.assertIsNone(catalog.load_catalog(os.path.join(self.tmp, "nope.yaml")))
+
+    def test_real_catalog_loads(self):
+        pages = catalog.load_catalog(PAGES_YAML)
+        self.assertTrue(pages)
+        self.assertTrue(any(p.get("page_type") == "browsers" for p in pages))
+
+
+if __name__ == "__main__":
+    unittest.main()
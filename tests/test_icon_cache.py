@@ -0,0 +1,117 @@
+"""Tests for BigLinux Welcome — rasterized icon caches."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+APP_DIR = str(
+    Path(__file__).resolve().parent.parent / "usr" / "share" / "biglinux" / "welcome"
+)
+sys.path.insert(0, APP_DIR)
+
+from icon_cache import RasterDiskCache, TextureCache  # noqa: E402
+
+
+class TestTextureCache(unittest.TestCase):
+    """Tests for icon_cache.TextureCache."""
+
+    def test_hit_and_miss_counters(self):
+        cache = TextureCache(100)
+        self.assertIsNone(cache.get(("a.svg", 64, 1)))
+        cache.put(("a.svg", 64, 1), "tex", 10)
+        self.assertEqual(cache.get(("a.svg", 64, 1)), "tex")
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = TextureCache(30)
+        cache.put("a", "A", 10)
+        cache.put("b", "B", 10)
+        cache.put("c", "C", 10)
+        cache.get("a")
+        cache.put("d", "D", 10)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "A")
+        self.assertEqual(cache.total_bytes, 30)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_replacing_key_updates_size(self):
+        cache = TextureCache(100)
+        cache.put("a", "A", 40)
+        cache.put("a", "A2", 10)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.total_bytes, 10)
+
+    def test_oversized_value_not_cached(self):
+        cache = TextureCache(10)
+        cache.put("big", "X", 11)
+        self.assertEqual(len(cache), 0)
+
+
+class TestRasterDiskCache(unittest.TestCase):
+    """Tests for icon_cache.RasterDiskCache."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = RasterDiskCache(os.path.join(self._tmp.name, "icons"), 100)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_key_depends_on_every_component(self):
+        base = RasterDiskCache.key("a.svg", 64, 1, 10)
+        self.assertNotEqual(base, RasterDiskCache.key("b.svg", 64, 1, 10))
+        self.assertNotEqual(base, RasterDiskCache.key("a.svg", 56, 1, 10))
+        self.assertNotEqual(base, RasterDiskCache.key("a.svg", 64, 2, 10))
+        self.assertNotEqual(base, RasterDiskCache.key("a.svg", 64, 1, 11))
+        self.assertEqual(base, RasterDiskCache.key("a.svg", 64, 1, 10))
+
+    def test_miss_then_hit(self):
+        key = RasterDiskCache.key("a.svg", 64, 1, 10)
+        self.assertIsNone(self.cache.lookup(key))
+        path = self.cache.store(key, b"png")
+        self.assertEqual(self.cache.lookup(key), path)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"png")
+
+    def test_evicts_least_recently_used(self):
+        old = self.cache.store("old", b"x" * 40)
+        recent = self.cache.store("recent", b"x" * 40)
+        now = time.time_ns()
+        os.utime(old, ns=(now - 3_000_000_000, now - 3_000_000_000))
+        os.utime(recent, ns=(now - 2_000_000_000, now - 2_000_000_000))
+        # A later read of "old" (atime) makes it the most recently used entry
+        os.utime(old, ns=(now - 1_000_000_000, now - 3_000_000_000))
+        self.cache.store("new", b"x" * 40)
+        self.assertIsNotNone(self.cache.lookup("old"))
+        self.assertIsNotNone(self.cache.lookup("new"))
+        self.assertIsNone(self.cache.lookup("recent"))
+
+    def test_lookup_does_not_write(self):
+        path = self.cache.store("key", b"png")
+        os.utime(path, ns=(1, 1))
+        self.assertEqual(self.cache.lookup("key"), path)
+        self.assertEqual(os.stat(path).st_mtime_ns, 1)
+
+    def test_evicts_stale_entries_under_cap(self):
+        stale = self.cache.store("stale", b"x")
+        os.utime(stale, ns=(1, 1))
+        self.cache.store("fresh", b"x")
+        self.assertIsNone(self.cache.lookup("stale"))
+        self.assertIsNotNone(self.cache.lookup("fresh"))
+
+    def test_store_failure_is_not_fatal(self):
+        blocker = os.path.join(self._tmp.name, "file")
+        with open(blocker, "w") as f:
+            f.write("")
+        cache = RasterDiskCache(os.path.join(blocker, "icons"))
+        with patch("builtins.print"):
+            self.assertIsNone(cache.store("k", b"png"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,252 @@
+"""Tests for BigLinux Welcome — installer output splitting, log and rules."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+APP_DIR = str(
+    Path(__file__).resolve().parent.parent / "usr" / "share" / "biglinux" / "welcome"
+)
+sys.path.insert(0, APP_DIR)
+
+from install_output import (  # noqa: E402
+    RULES_NAME,
+    InstallLog,
+    LineClassifier,
+    LineSplitter,
+    new_log_path,
+)
+
+RULES_PATH = os.path.join(APP_DIR, RULES_NAME)
+
+
+class TestLineSplitter(unittest.TestCase):
+    """Tests for install_output.LineSplitter."""
+
+    def test_newline_and_cr(self):
+        splitter = LineSplitter()
+        self.assertEqual(
+            splitter.feed(b"prog 30%\rinstalling foo\n"),
+            [("prog 30%", False), ("installing foo", True)],
+        )
+        self.assertEqual(splitter.pending, b"")
+
+    def test_incomplete_line_kept(self):
+        splitter = LineSplitter()
+        lines = splitter.feed(b"line1\nline2\npartial")
+        self.assertEqual(lines, [("line1", True), ("line2", True)])
+        self.assertEqual(splitter.pending, b"partial")
+        self.assertEqual(splitter.feed(b" data\n"), [("partial data", True)])
+
+    def test_empty_lines_reported(self):
+        self.assertEqual(
+            LineSplitter().feed(b"\n\nhello\n"),
+            [("", True), ("", True), ("hello", True)],
+        )
+
+    def test_crlf_gives_empty_newline_line(self):
+        self.assertEqual(
+            LineSplitter().feed(b"a\r\nb\n"), [("a", False), ("", True), ("b", True)]
+        )
+
+    def test_byte_at_a_time(self):
+        splitter = LineSplitter()
+        lines = []
+        for byte in b"one\rtwo\nthree":
+            lines += splitter.feed(bytes([byte]))
+        self.assertEqual(lines, [("one", False), ("two", True)])
+        self.assertEqual(splitter.flush(), "three")
+        self.assertIsNone(splitter.flush())
+
+    def test_multibyte_split_across_chunks(self):
+        splitter = LineSplitter()
+        data = "Instalação\n".encode()
+        self.assertEqual(splitter.feed(data[:7]), [])
+        self.assertEqual(splitter.feed(data[7:]), [("Instalação", True)])
+
+    def test_overlong_line_is_cut(self):
+        splitter = LineSplitter(max_line=4)
+        self.assertEqual(splitter.feed(b"abcdefghij"), [("abcd", True), ("efgh", True)])
+        self.assertEqual(splitter.pending, b"ij")
+        self.assertEqual(splitter.feed(b"\n"), [("ij", True)])
+
+
+class TestInstallLog(unittest.TestCase):
+    """Tests for install_output.InstallLog and new_log_path."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "run.log")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def read(self):
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_keeps_recent_lines_and_spills_all(self):
+        log = InstallLog(max_lines=3, path=self.path)
+        log.extend(["a", "b"])
+        log.extend(["c", "d", "e"])
+        self.assertEqual(log.recent(), ["c", "d", "e"])
+        self.assertEqual(log.total, 5)
+        self.assertEqual(log.dropped, 2)
+        log.flush()
+        self.assertEqual(self.read(), "a\nb\nc\nd\ne\n")
+
+    def test_reopens_after_close(self):
+        log = InstallLog(path=self.path)
+        log.extend(["first"])
+        log.close()
+        log.extend(["late"])
+        log.close()
+        self.assertEqual(self.read(), "first\nlate\n")
+
+    def test_without_file(self):
+        log = InstallLog(max_lines=2)
+        log.extend(["a", "b", "c"])
+        log.flush()
+        log.close()
+        self.assertEqual(log.recent(), ["b", "c"])
+
+    def test_unwritable_file_keeps_memory_log(self):
+        log = InstallLog(path=os.path.join(self._tmp.name, "missing", "run.log"))
+        log.extend(["a"])
+        self.assertIsNone(log.path)
+        log.extend(["b"])
+        self.assertEqual(log.recent(), ["a", "b"])
+
+    def test_new_log_path_prunes_old_runs(self):
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": self._tmp.name}):
+            directory = os.path.dirname(new_log_path("firefox"))
+            for i in range(4):
+                old = os.path.join(directory, f"old{i}.log")
+                with open(old, "w"):
+                    pass
+                os.utime(old, (time.time() - 100 + i,) * 2)
+            path = new_log_path("firefox", keep=3)
+        self.assertTrue(path.startswith(directory + os.sep))
+        self.assertTrue(os.path.basename(path).startswith("firefox-"))
+        self.assertEqual(sorted(os.listdir(directory)), ["old2.log", "old3.log"])
+
+
+class TestInstallRules(unittest.TestCase):
+    """The shipped install_rules.json milestones and labels."""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(RULES_PATH, encoding="utf-8") as f:
+            cls.rules = LineClassifier.from_json(f.read())
+        cls.milestones = cls.rules.milestones
+
+    def test_milestones_are_sorted_by_fraction(self):
+        fractions = [m.fraction for m in self.milestones]
+        self.assertEqual(fractions, sorted(fractions))
+
+    def test_all_milestones_between_0_and_1(self):
+        for m in self.milestones:
+            self.assertGreater(m.fraction, 0.0, f"Milestone '{m.keyword}' is <= 0")
+            self.assertLessEqual(m.fraction, 1.0, f"Milestone '{m.keyword}' is > 1")
+
+    def test_key_milestones_present(self):
+        keywords = {m.keyword for m in self.milestones}
+        self.assertIn("synchronizing", keywords)
+        self.assertIn("installing", keywords)
+        self.assertIn("running post-transaction hooks", keywords)
+
+    def test_cancel_cutoff_is_a_milestone(self):
+        fractions = {m.fraction for m in self.milestones}
+        self.assertIn(self.rules.cancel_cutoff, fractions)
+
+    def test_every_milestone_has_a_label(self):
+        for m in self.milestones:
+            self.assertIsInstance(m.label, str)
+            self.assertTrue(m.label, f"Empty label for '{m.keyword}'")
+
+
+class TestLineClassifier(unittest.TestCase):
+    """Tests for install_output.LineClassifier with the shipped rules."""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(RULES_PATH, encoding="utf-8") as f:
+            cls.rules = LineClassifier.from_json(f.read())
+
+    def classify(self, line, after=0.0, with_tag=True):
+        return self.rules.classify(line, after, with_tag)
+
+    def test_tag_priority(self):
+        self.assertEqual(self.classify("error: could not open file").tag, "error")
+        self.assertEqual(self.classify("Done, no errors").tag, "error")
+        self.assertEqual(self.classify("Done.").tag, "success")
+        self.assertEqual(self.classify("warning: dependency cycle").tag, "warning")
+        self.assertIsNone(self.classify("some random output").tag)
+        self.assertIsNone(self.classify("").tag)
+
+    def test_starts_rules_need_line_start(self):
+        self.assertEqual(self.classify("  checking keyring...").tag, "info")
+        self.assertEqual(self.classify("Packages (3): ").tag, "dim")
+        self.assertIsNone(self.classify("now installing").tag)
+
+    def test_overlapping_keywords(self):
+        result = self.classify("Checking package integrity...")
+        self.assertEqual(result.milestone.keyword, "checking package integrity")
+        self.assertEqual(result.tag, "info")
+
+    def test_milestone_after_current(self):
+        line = "(1/1) installing firefox"
+        self.assertEqual(self.classify(line).milestone.fraction, 0.85)
+        self.assertEqual(self.classify(line).milestone.label, "Installing…")
+        self.assertIsNone(self.classify(line, after=0.85).milestone)
+
+    def test_first_milestone_in_rule_order(self):
+        result = self.classify("installing while synchronizing", after=0.0)
+        self.assertEqual(result.milestone.keyword, "synchronizing")
+        result = self.classify("installing while synchronizing", after=0.05)
+        self.assertEqual(result.milestone.keyword, "installing")
+
+    def test_download_progress(self):
+        line = " firefox-138.0.4-1  45.2 MiB  12.5 MiB/s 00:03 [###] 58%"
+        self.assertEqual(self.classify(line, 0.20).download, ("12.5 MiB/s", 58))
+        self.assertIsNone(self.classify("12.5 mib/s 58%", 0.20).download)
+        self.assertIsNone(self.classify("12.5 MiB/s no percent", 0.20).download)
+        self.assertTrue(self.classify(" firefox downloading...", 0.20).downloading)
+
+    def test_download_only_during_download_phase(self):
+        line = " firefox downloading... 12.5 MiB/s 58%"
+        self.assertFalse(self.classify(line, 0.0).downloading)
+        self.assertFalse(self.classify(line, 0.60).downloading)
+        self.assertIsNone(self.classify("12.5 MiB/s 58%", 0.60).download)
+
+    def test_tags_can_be_skipped(self):
+        self.assertIsNone(self.classify("error: failed", with_tag=False).tag)
+        result = self.classify("(1/1) installing firefox", with_tag=False)
+        self.assertEqual(result.milestone.keyword, "installing")
+
+    def test_rules_from_data(self):
+        rules = LineClassifier(
+            {
+                "milestones": [
+                    {"match": "Installing:", "fraction": 0.5, "label": "Flatpak"}
+                ],
+                "tags": [{"tag": "info", "starts": ["Info:"]}],
+            }
+        )
+        result = rules.classify("info: installing: org.mozilla.firefox")
+        self.assertEqual(result.milestone.label, "Flatpak")
+        self.assertEqual(result.tag, "info")
+        self.assertIsNone(result.download)
+        self.assertEqual(LineClassifier({}).classify("error"), type(result)())
+
+    def test_unsupported_version(self):
+        with self.assertRaises(ValueError):
+            LineClassifier.from_json('{"version": 99}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Tests for BigLinux Welcome — installed browser index."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+APP_DIR = str(
+    Path(__file__).resolve().parent.parent / "usr" / "share" / "biglinux" / "welcome"
+)
+sys.path.insert(0, APP_DIR)
+
+from installed import InstalledIndex  # noqa: E402
+
+
+class TestInstalledIndex(unittest.TestCase):
+    """Tests for installed.InstalledIndex."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.bin = os.path.join(self._tmp.name, "bin")
+        self.apps = os.path.join(self._tmp.name, "flatpak", "app")
+        os.makedirs(self.bin)
+        self.firefox = os.path.join(self.bin, "firefox")
+        self.chromium = os.path.join(self.bin, "chromium")
+        self.flatpak = os.path.join(self.apps, "org.mozilla.firefox")
+        self.touch(self.firefox)
+        self.touch(os.path.join(self.bin, "unrelated"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def touch(self, path):
+        with open(path, "w"):
+            pass
+
+    def index(self):
+        return InstalledIndex([self.firefox, self.chromium, self.flatpak, ""])
+
+    def test_initial_scan(self):
+        index = self.index()
+        self.assertTrue(index.exists(self.firefox))
+        self.assertFalse(index.exists(self.chromium))
+        self.assertFalse(index.exists(self.flatpak))
+        self.assertFalse(index.exists(""))
+
+    def test_one_listing_per_directory(self):
+        with patch("installed.os.scandir", wraps=os.scandir) as scandir:
+            self.index()
+        self.assertEqual(
+            sorted(call.args[0] for call in scandir.call_args_list),
+            sorted([self.bin, self.apps]),
+        )
+
+    def test_directories(self):
+        directories = self.index().directories()
+        self.assertEqual(sorted(directories), sorted([self.bin, self.apps]))
+
+    def test_rescan_reports_changes(self):
+        index = self.index()
+        self.touch(os.path.join(self.bin, "other"))
+        self.assertFalse(index.rescan(self.bin))
+
+        self.touch(self.chromium)
+        os.unlink(self.firefox)
+        self.assertEqual(index.rescan(self.bin), {self.chromium, self.firefox})
+        self.assertTrue(index.exists(self.chromium))
+        self.assertFalse(index.exists(self.firefox))
+
+        os.makedirs(self.flatpak)
+        self.assertEqual(index.rescan_all(), {self.flatpak})
+        self.assertTrue(index.exists(self.flatpak))
+
+    def test_wildcard_names(self):
+        apps = os.path.join(self._tmp.name, "Applications")
+        os.makedirs(apps)
+        pattern = os.path.join(apps, "Firefox*.AppImage")
+        index = InstalledIndex([pattern])
+        self.assertFalse(index.exists(pattern))
+
+        self.touch(os.path.join(apps, "Firefox-128.0-x86_64.AppImage"))
+        self.assertEqual(index.rescan(apps), {pattern})
+        self.assertTrue(index.exists(pattern))
+
+    def test_rescan_unknown_directory(self):
+        self.assertFalse(self.index().rescan(self._tmp.name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,293 @@
+"""Tests for BigLinux Welcome — XDG default browser resolver and writer."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+APP_DIR = str(
+    Path(__file__).resolve().parent.parent / "usr" / "share" / "biglinux" / "welcome"
+)
+sys.path.insert(0, APP_DIR)
+
+import mimeapps  # noqa: E402
+
+
+class MimeappsTestCase(unittest.TestCase):
+    """Isolated XDG config and data directories under a temp dir."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.config_home = os.path.join(self.root, "config")
+        self.config_dir = os.path.join(self.root, "etc-xdg")
+        self.data_home = os.path.join(self.root, "data")
+        self.data_dir = os.path.join(self.root, "usr-share")
+        env = {
+            "XDG_CONFIG_HOME": self.config_home,
+            "XDG_CONFIG_DIRS": self.config_dir,
+            "XDG_DATA_HOME": self.data_home,
+            "XDG_DATA_DIRS": self.data_dir,
+            "XDG_CURRENT_DESKTOP": "KDE",
+        }
+        self.env = patch.dict(os.environ, env)
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def write(self, directory, name, text):
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def install(self, desktop_id, data_dir=None):
+        apps = os.path.join(data_dir or self.data_dir, "applications")
+        self.write(apps, desktop_id, "[Desktop Entry]\n")
+
+
+class TestMimeappsPaths(MimeappsTestCase):
+    """Tests for mimeapps.mimeapps_paths."""
+
+    def test_lookup_order(self):
+        self.assertEqual(
+            mimeapps.mimeapps_paths(),
+            [
+                os.path.join(self.config_home, "kde-mimeapps.list"),
+                os.path.join(self.config_home, "mimeapps.list"),
+                os.path.join(self.config_dir, "kde-mimeapps.list"),
+                os.path.join(self.config_dir, "mimeapps.list"),
+                os.path.join(self.data_home, "applications", "kde-mimeapps.list"),
+                os.path.join(self.data_home, "applications", "mimeapps.list"),
+                os.path.join(self.data_dir, "applications", "kde-mimeapps.list"),
+                os.path.join(self.data_dir, "applications", "mimeapps.list"),
+            ],
+        )
+
+
+class TestReadSection(MimeappsTestCase):
+    """Tests for mimeapps.read_section."""
+
+    def test_parses_only_requested_section(self):
+        path = self.write(
+            self.config_home,
+            "mimeapps.list",
+            "# comment\n"
+            "[Added Associations]\n"
+            "x-scheme-handler/http=other.desktop;\n"
+            "\n"
+            "[Default Applications]\n"
+            "x-scheme-handler/http = firefox.desktop;chromium.desktop;\n"
+            "text/plain=kate.desktop\n",
+        )
+        self.assertEqual(
+            mimeapps.read_section(path, mimeapps.DEFAULT_SECTION),
+            {
+                "x-scheme-handler/http": ["firefox.desktop", "chromium.desktop"],
+                "text/plain": ["kate.desktop"],
+            },
+        )
+
+    def test_missing_file(self):
+        path = os.path.join(self.root, "missing.list")
+        self.assertEqual(mimeapps.read_section(path, mimeapps.DEFAULT_SECTION), {})
+
+
+class TestQueryDefault(MimeappsTestCase):
+    """Tests for mimeapps.query_default."""
+
+    HTTP = "x-scheme-handler/http"
+
+    def defaults(self, directory, name, *desktop_ids):
+        self.write(
+            directory,
+            name,
+            f"[Default Applications]\n{self.HTTP}={';'.join(desktop_ids)};\n",
+        )
+
+    def test_none_configured(self):
+        self.assertIsNone(mimeapps.query_default(self.HTTP))
+
+    def test_user_overrides_system(self):
+        self.install("firefox.desktop")
+        self.install("chromium.desktop")
+        self.defaults(self.config_dir, "mimeapps.list", "firefox.desktop")
+        self.defaults(self.config_home, "mimeapps.list", "chromium.desktop")
+        self.assertEqual(mimeapps.query_default(self.HTTP), "chromium.desktop")
+
+    def test_desktop_specific_overrides_generic(self):
+        self.install("firefox.desktop")
+        self.install("org.kde.falkon.desktop")
+        self.defaults(self.config_home, "mimeapps.list", "firefox.desktop")
+        self.defaults(self.config_home, "kde-mimeapps.list", "org.kde.falkon.desktop")
+        self.assertEqual(mimeapps.query_default(self.HTTP), "org.kde.falkon.desktop")
+
+    def test_skips_uninstalled_applications(self):
+        self.install("firefox.desktop", data_dir=self.data_home)
+        self.defaults(
+            self.config_home, "mimeapps.list", "removed.desktop", "firefox.desktop"
+        )
+        self.assertEqual(mimeapps.query_default(self.HTTP), "firefox.desktop")
+
+
+class TestDefaultBrowserResolver(MimeappsTestCase):
+    """Tests for mimeapps.DefaultBrowserResolver."""
+
+    def test_caches_until_invalidated(self):
+        self.install("firefox.desktop")
+        resolver = mimeapps.DefaultBrowserResolver()
+        self.assertIsNone(resolver.get())
+
+        self.write(
+            self.config_home,
+            "mimeapps.list",
+            "[Default Applications]\nx-scheme-handler/http=firefox.desktop\n",
+        )
+        self.assertIsNone(resolver.get())
+
+        resolver.invalidate()
+        self.assertEqual(resolver.get(), "firefox.desktop")
+
+    def kdeglobals(self, directory, value):
+        self.write(directory, "kdeglobals", f"[General]\nBrowserApplication={value}\n")
+
+    def test_kdeglobals_first_on_kde(self):
+        self.install("firefox.desktop")
+        self.write(
+            self.config_home,
+            "mimeapps.list",
+            "[Default Applications]\nx-scheme-handler/http=firefox.desktop\n",
+        )
+        self.kdeglobals(self.config_dir, "chromium")
+        self.assertEqual(mimeapps.DefaultBrowserResolver().get(), "chromium.desktop")
+
+        self.kdeglobals(self.config_home, "brave-browser.desktop")
+        self.assertEqual(
+            mimeapps.DefaultBrowserResolver().get(), "brave-browser.desktop"
+        )
+
+    def test_kdeglobals_command_is_unknown(self):
+        self.install("firefox.desktop")
+        self.write(
+            self.config_home,
+            "mimeapps.list",
+            "[Default Applications]\nx-scheme-handler/http=firefox.desktop\n",
+        )
+        self.kdeglobals(self.config_home, "!firefox --new-window")
+        self.assertIsNone(mimeapps.DefaultBrowserResolver().get())
+
+    def test_kdeglobals_ignored_elsewhere(self):
+        self.install("firefox.desktop")
+        self.write(
+            self.config_home,
+            "mimeapps.list",
+            "[Default Applications]\nx-scheme-handler/http=firefox.desktop\n",
+        )
+        self.kdeglobals(self.config_home, "chromium.desktop")
+        with patch.dict(os.environ, {"XDG_CURRENT_DESKTOP": "GNOME"}):
+            resolver = mimeapps.DefaultBrowserResolver()
+            self.assertEqual(resolver.get(), "firefox.desktop")
+            self.assertNotIn(
+                os.path.join(self.config_home, "kdeglobals"), resolver.paths()
+            )
+
+    def test_read_value_with_key_suffix(self):
+        path = self.write(
+            self.config_home,
+            "kdeglobals",
+            "[General]\nBrowserApplication[$e]=firefox.desktop\n"
+            "[Other]\nBrowserApplication=other.desktop\n",
+        )
+        self.assertEqual(
+            mimeapps.read_value(path, "General", "BrowserApplication"),
+            "firefox.desktop",
+        )
+        self.assertIsNone(mimeapps.read_value(path, "Missing", "BrowserApplication"))
+
+
+class TestUpdateMimeapps(unittest.TestCase):
+    """Tests for mimeapps.update_mimeapps."""
+
+    def test_empty_file(self):
+        self.assertEqual(
+            mimeapps.update_mimeapps("", "firefox.desktop"),
+            "[Default Applications]\n"
+            "x-scheme-handler/http=firefox.desktop\n"
+            "x-scheme-handler/https=firefox.desktop\n"
+            "\n"
+            "[Added Associations]\n"
+            "x-scheme-handler/http=firefox.desktop;\n"
+            "x-scheme-handler/https=firefox.desktop;\n",
+        )
+
+    def test_replaces_defaults_and_keeps_other_lines(self):
+        text = (
+            "[Added Associations]\n"
+            "x-scheme-handler/http=chromium.desktop;firefox.desktop;\n"
+            "text/plain=kate.desktop;\n"
+            "\n"
+            "[Default Applications]\n"
+            "x-scheme-handler/https=chromium.desktop\n"
+            "text/plain=kate.desktop\n"
+        )
+        self.assertEqual(
+            mimeapps.update_mimeapps(text, "firefox.desktop"),
+            "[Added Associations]\n"
+            "x-scheme-handler/http=firefox.desktop;chromium.desktop;\n"
+            "text/plain=kate.desktop;\n"
+            "x-scheme-handler/https=firefox.desktop;\n"
+            "\n"
+            "[Default Applications]\n"
+            "x-scheme-handler/https=firefox.desktop\n"
+            "text/plain=kate.desktop\n"
+            "x-scheme-handler/http=firefox.desktop\n",
+        )
+
+
+class TestSetDefaultBrowser(MimeappsTestCase):
+    """Tests for mimeapps.set_default_browser."""
+
+    def test_round_trip(self):
+        self.install("firefox.desktop")
+        self.assertTrue(mimeapps.set_default_browser("firefox.desktop"))
+        self.assertEqual(
+            mimeapps.query_default("x-scheme-handler/https"), "firefox.desktop"
+        )
+        self.assertEqual(os.listdir(self.config_home), ["mimeapps.list"])
+
+    def test_updates_shadowing_desktop_list(self):
+        self.install("firefox.desktop")
+        self.install("chromium.desktop")
+        self.write(
+            self.config_home,
+            "kde-mimeapps.list",
+            "[Default Applications]\nx-scheme-handler/http=chromium.desktop\n",
+        )
+        self.assertTrue(mimeapps.set_default_browser("firefox.desktop"))
+        self.assertEqual(mimeapps.DefaultBrowserResolver().get(), "firefox.desktop")
+
+    def test_keeps_symlink_and_mode(self):
+        self.install("firefox.desktop")
+        target = self.write(self.root, "dotfiles-mimeapps.list", "")
+        os.chmod(target, 0o600)
+        os.makedirs(self.config_home)
+        link = os.path.join(self.config_home, "mimeapps.list")
+        os.symlink(target, link)
+        self.assertTrue(mimeapps.set_default_browser("firefox.desktop"))
+        self.assertTrue(os.path.islink(link))
+        self.assertEqual(os.stat(target).st_mode & 0o777, 0o600)
+        self.assertIn("firefox.desktop", open(target, encoding="utf-8").read())
+
+    def test_needs_script(self):
+        self.assertTrue(mimeapps.needs_script())
+        with patch.dict(os.environ, {"XDG_CURRENT_DESKTOP": "GNOME"}):
+            self.assertFalse(mimeapps.needs_script())
+
+
+if __name__ == "__main__":
+    unittest.main()
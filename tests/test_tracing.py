@@ -0,0 +1,82 @@
+"""Tests for BigLinux Welcome — startup tracer."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+APP_DIR = str(
+    Path(__file__).resolve().parent.parent / "usr" / "share" / "biglinux" / "welcome"
+)
+sys.path.insert(0, APP_DIR)
+
+import tracing  # noqa: E402
+
+
+class TestTracing(unittest.TestCase):
+    """Tests for tracing.configure, span, mark and write."""
+
+    def setUp(self):
+        tracing._path = None
+        tracing._events.clear()
+
+    def tearDown(self):
+        tracing._path = None
+        tracing._events.clear()
+
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            tracing.configure(["main.py"])
+        self.assertFalse(tracing.is_enabled())
+        with tracing.span("noop"):
+            pass
+        tracing.mark("noop")
+        self.assertEqual(tracing._events, [])
+
+    def test_cli_flag_is_removed_from_argv(self):
+        argv = ["main.py", "--trace=/tmp/x.json", "--other"]
+        with patch.dict(os.environ, {}, clear=True):
+            tracing.configure(argv)
+        self.assertEqual(argv, ["main.py", "--other"])
+        self.assertEqual(tracing._path, "/tmp/x.json")
+
+    def test_env_var_enables_default_path(self):
+        with patch.dict(os.environ, {tracing.ENV_VAR: "1"}, clear=True):
+            tracing.configure(["main.py"])
+        self.assertTrue(tracing.is_enabled())
+        self.assertTrue(tracing._path.endswith(".json"))
+
+    def test_span_and_traced_record_complete_events(self):
+        tracing.enable("/dev/null")
+
+        @tracing.traced("work")
+        def work():
+            return 42
+
+        with tracing.span("phase", page=1):
+            self.assertEqual(work(), 42)
+        names = [e["name"] for e in tracing._events]
+        self.assertEqual(names, ["work", "phase"])
+        phase = tracing._events[1]
+        self.assertEqual(phase["ph"], "X")
+        self.assertEqual(phase["args"], {"page": 1})
+        self.assertGreaterEqual(phase["dur"], 0)
+
+    def test_write_produces_chrome_trace_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+            tracing.enable(path)
+            tracing.mark("first frame")
+            with patch("builtins.print"):
+                self.assertEqual(tracing.write(), path)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        self.assertEqual(data["traceEvents"][0]["name"], "first frame")
+        self.assertEqual(data["traceEvents"][0]["ph"], "i")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -74,6 +74,26 @@ class TestExtractStrings(unittest.TestCase):
         self.assertEqual(result, {"Valid"})
 
 
+class TestGenerateGresource(unittest.TestCase):
+    """Tests for generate_gresource manifest generation."""
+
+    def test_collects_css_catalog_and_images(self):
+        from generate_gresource import collect_files
+
+        files = collect_files(Path(APP_DIR))
+        self.assertEqual(files[:2], ["style.css", "pages.yaml"])
+        self.assertIn("image/browsers/firefox.svg", files)
+        self.assertTrue(all(not f.startswith("/") for f in files))
+
+    def test_manifest_uses_app_prefix(self):
+        from generate_gresource import PREFIX, build_manifest
+
+        xml = build_manifest(["style.css", "image/a&b.svg"])
+        self.assertIn(f'<gresource prefix="{PREFIX}">', xml)
+        self.assertIn("<file>style.css</file>", xml)
+        self.assertIn("<file>image/a&amp;b.svg</file>", xml)
+
+
 class TestParseOsRelease(unittest.TestCase):
     """Tests for utils.parse_os_release."""
 
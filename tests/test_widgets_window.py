@@ -3,7 +3,7 @@
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, call
 
 APP_DIR = str(
     Path(__file__).resolve().parent.parent / "usr" / "share" / "biglinux" / "welcome"
@@ -53,126 +53,41 @@ class TestGetLineTag(unittest.TestCase):
         self.assertIsNone(self.tag(""))
 
 
-class TestMilestones(unittest.TestCase):
-    """Tests for InstallPanel milestone matching logic."""
-
-    @classmethod
-    def setUpClass(cls):
-        from widgets import InstallPanel
-
-        cls.milestones = InstallPanel._MILESTONES
-
-    def test_milestones_are_sorted_by_fraction(self):
-        fractions = [f for _, f in self.milestones]
-        self.assertEqual(fractions, sorted(fractions))
-
-    def test_all_milestones_between_0_and_1(self):
-        for keyword, fraction in self.milestones:
-            self.assertGreater(fraction, 0.0, f"Milestone '{keyword}' is <= 0")
-            self.assertLessEqual(fraction, 1.0, f"Milestone '{keyword}' is > 1")
-
-    def test_key_milestones_present(self):
-        keywords = {k for k, _ in self.milestones}
-        self.assertIn("synchronizing", keywords)
-        self.assertIn("installing", keywords)
-        self.assertIn("running post-transaction hooks", keywords)
-
-    def test_cancel_cutoff_is_a_milestone(self):
-        from widgets import InstallPanel
-
-        cutoff = InstallPanel._CANCEL_CUTOFF
-        milestone_fractions = {f for _, f in self.milestones}
-        self.assertIn(cutoff, milestone_fractions)
-
-
-class TestPhaseLabels(unittest.TestCase):
-    """Tests for InstallPanel._PHASE_LABELS coverage."""
-
-    @classmethod
-    def setUpClass(cls):
-        from widgets import InstallPanel
-
-        cls.milestones = InstallPanel._MILESTONES
-        cls.labels = InstallPanel._PHASE_LABELS
-
-    def test_every_milestone_has_a_label(self):
-        for keyword, _ in self.milestones:
-            self.assertIn(
-                keyword,
-                self.labels,
-                f"Milestone '{keyword}' missing from _PHASE_LABELS",
-            )
-
-    def test_labels_are_nonempty_strings(self):
-        for keyword, label in self.labels.items():
-            self.assertIsInstance(label, str)
-            self.assertTrue(len(label) > 0, f"Empty label for '{keyword}'")
-
-
-class TestFlushLineBuffer(unittest.TestCase):
-    """Tests for window._flush_line_buffer."""
+class TestDispatchLines(unittest.TestCase):
+    """Tests for browser_page._dispatch_lines."""
 
     def setUp(self):
         self.mock_panel = MagicMock()
-        self.glib_patcher = patch("window.GLib")
-        self.mock_glib = self.glib_patcher.start()
-        # Make idle_add just call the function
-        self.mock_glib.idle_add = MagicMock()
-
-    def tearDown(self):
-        self.glib_patcher.stop()
 
-    def _flush(self, buf):
-        from window import _flush_line_buffer
+    def _dispatch(self, lines):
+        from browser_page import _dispatch_lines
 
-        return _flush_line_buffer(buf, self.mock_panel)
+        _dispatch_lines(lines, self.mock_panel)
 
-    def test_newline_dispatches_to_append_log(self):
-        remainder = self._flush(b"hello world\n")
-        self.assertEqual(remainder, b"")
-        self.mock_glib.idle_add.assert_called_once_with(
-            self.mock_panel.append_log, "hello world"
-        )
+    def test_newline_dispatches_to_post_log(self):
+        self._dispatch([("hello world", True)])
+        self.mock_panel.post_log.assert_called_once_with("hello world")
+        self.mock_panel.post_progress.assert_not_called()
 
-    def test_cr_dispatches_to_parse_progress(self):
-        remainder = self._flush(b"progress 50%\r")
-        self.assertEqual(remainder, b"")
-        self.mock_glib.idle_add.assert_called_once_with(
-            self.mock_panel.parse_progress, "progress 50%"
-        )
+    def test_cr_dispatches_to_post_progress(self):
+        self._dispatch([("progress 50%", False)])
+        self.mock_panel.post_progress.assert_called_once_with("progress 50%")
+        self.mock_panel.post_log.assert_not_called()
 
     def test_status_lines_skipped(self):
-        remainder = self._flush(b"STATUS:started\n")
-        self.assertEqual(remainder, b"")
-        self.mock_glib.idle_add.assert_not_called()
-
-    def test_incomplete_line_kept_in_buffer(self):
-        remainder = self._flush(b"partial data without newline")
-        self.assertEqual(remainder, b"partial data without newline")
-        self.mock_glib.idle_add.assert_not_called()
-
-    def test_multiple_lines(self):
-        remainder = self._flush(b"line1\nline2\npartial")
-        self.assertEqual(remainder, b"partial")
-        calls = self.mock_glib.idle_add.call_args_list
-        self.assertEqual(len(calls), 2)
-        self.assertEqual(calls[0], call(self.mock_panel.append_log, "line1"))
-        self.assertEqual(calls[1], call(self.mock_panel.append_log, "line2"))
+        self._dispatch([("STATUS:started", True)])
+        self.assertEqual(self.mock_panel.mock_calls, [])
 
     def test_empty_lines_skipped(self):
-        remainder = self._flush(b"\n\nhello\n")
-        self.assertEqual(remainder, b"")
-        calls = self.mock_glib.idle_add.call_args_list
-        self.assertEqual(len(calls), 1)
-        self.assertEqual(calls[0], call(self.mock_panel.append_log, "hello"))
+        self._dispatch([("", True), ("", True), ("hello", True)])
+        self.assertEqual(self.mock_panel.mock_calls, [call.post_log("hello")])
 
     def test_mixed_cr_and_newline(self):
-        remainder = self._flush(b"prog 30%\rinstalling foo\n")
-        self.assertEqual(remainder, b"")
-        calls = self.mock_glib.idle_add.call_args_list
-        self.assertEqual(len(calls), 2)
-        self.assertEqual(calls[0], call(self.mock_panel.parse_progress, "prog 30%"))
-        self.assertEqual(calls[1], call(self.mock_panel.append_log, "installing foo"))
+        self._dispatch([("prog 30%", False), ("installing foo", True)])
+        self.assertEqual(
+            self.mock_panel.mock_calls,
+            [call.post_progress("prog 30%"), call.post_log("installing foo")],
+        )
 
 
 if __name__ == "__main__":
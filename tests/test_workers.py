@@ -0,0 +1,100 @@
+"""Tests for BigLinux Welcome — background workers."""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+APP_DIR = str(
+    Path(__file__).resolve().parent.parent / "usr" / "share" / "biglinux" / "welcome"
+)
+sys.path.insert(0, APP_DIR)
+
+from workers import LatestWinsWorker  # noqa: E402
+
+TIMEOUT = 5
+
+
+class TestLatestWinsWorker(unittest.TestCase):
+    """Tests for workers.LatestWinsWorker."""
+
+    def setUp(self):
+        self.worker = LatestWinsWorker("test-worker")
+        self.ran = []
+        self.done = []
+        self.finished = threading.Event()
+
+    def job(self, value, gate=None):
+        if gate is not None:
+            gate.wait(TIMEOUT)
+        self.ran.append(value)
+        return value * 10
+
+    def on_done(self, result):
+        self.done.append(result)
+        self.finished.set()
+
+    def test_single_job(self):
+        self.worker.submit(self.job, 1, on_done=self.on_done)
+        self.assertTrue(self.finished.wait(TIMEOUT))
+        self.assertEqual(self.ran, [1])
+        self.assertEqual(self.done, [10])
+
+    def test_burst_runs_first_and_last_only(self):
+        gate = threading.Event()
+        self.worker.submit(self.job, 1, gate, on_done=self.on_done)
+        for value in (2, 3, 4):
+            self.worker.submit(self.job, value, on_done=self.on_done)
+        gate.set()
+        self.assertTrue(self.finished.wait(TIMEOUT))
+        self.assertEqual(self.ran, [1, 4])
+        # The superseded first job's completion is dropped
+        self.assertEqual(self.done, [40])
+        self.assertEqual(self.worker.generation, 4)
+
+    def test_completion_superseded_before_dispatch(self):
+        deferred = []
+        dispatched = threading.Event()
+
+        def dispatch(func, *args):
+            deferred.append((func, args))
+            dispatched.set()
+
+        worker = LatestWinsWorker("test-worker", dispatch=dispatch)
+        worker.submit(self.job, 1, on_done=self.on_done)
+        self.assertTrue(dispatched.wait(TIMEOUT))
+
+        # Newer request made while the completion waits on the main loop
+        worker.submit(self.job, 2)
+        func, args = deferred[0]
+        self.assertFalse(func(*args))
+        self.assertEqual(self.done, [])
+
+    def test_failing_job_reports_none(self):
+        def fail():
+            raise RuntimeError("boom")
+
+        with patch("builtins.print"):
+            self.worker.submit(fail, on_done=self.on_done)
+            self.assertTrue(self.finished.wait(TIMEOUT))
+        self.assertEqual(self.done, [None])
+
+    def test_single_thread(self):
+        threads = set()
+        gate = threading.Event()
+
+        def record(value):
+            threads.add(threading.get_ident())
+            return value
+
+        self.worker.submit(self.job, 0, gate)
+        self.worker.submit(record, 1)
+        gate.set()
+        self.worker.submit(record, 2, on_done=self.on_done)
+        self.assertTrue(self.finished.wait(TIMEOUT))
+        self.assertEqual(len(threads), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
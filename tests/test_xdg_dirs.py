@@ -0,0 +1,64 @@
+"""Tests for BigLinux Welcome — XDG helpers and atomic writes."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+APP_DIR = str(
+    Path(__file__).resolve().parent.parent / "usr" / "share" / "biglinux" / "welcome"
+)
+sys.path.insert(0, APP_DIR)
+
+import xdg_dirs  # noqa: E402
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Tests for xdg_dirs.atomic_write."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_creates_file_and_directories(self):
+        path = os.path.join(self.root, "a", "b", "file.json")
+        xdg_dirs.atomic_write(path, "{}")
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "{}")
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o644)
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["file.json"])
+
+    def test_new_file_mode(self):
+        path = os.path.join(self.root, "private.json")
+        xdg_dirs.atomic_write(path, "{}", mode=0o600)
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+
+    def test_keeps_existing_mode(self):
+        path = os.path.join(self.root, "file.list")
+        xdg_dirs.atomic_write(path, "old", mode=0o640)
+        xdg_dirs.atomic_write(path, "new")
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+
+    def test_follows_symlink(self):
+        target = os.path.join(self.root, "target.list")
+        link = os.path.join(self.root, "link.list")
+        xdg_dirs.atomic_write(target, "old")
+        os.symlink(target, link)
+        xdg_dirs.atomic_write(link, "new")
+        self.assertTrue(os.path.islink(link))
+        with open(target, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "new")
+
+    def test_failure_leaves_no_temp_file(self):
+        path = os.path.join(self.root, "file.txt")
+        with self.assertRaises(UnicodeEncodeError):
+            xdg_dirs.atomic_write(path, "\ud800")
+        self.assertEqual(os.listdir(self.root), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
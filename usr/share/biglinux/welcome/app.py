@@ -2,35 +2,62 @@
 
 from __future__ import annotations
 
-import os
+import tracing
 
-import gi
+with tracing.span("import gi"):
+    import gi
 
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
+    gi.require_version("Gtk", "4.0")
+    gi.require_version("Adw", "1")
 
-from gi.repository import Adw, Gdk, Gtk  # noqa: E402
+    from gi.repository import Adw, Gdk, Gio, Gtk  # noqa: E402
 
-from utils import APP_PATH  # noqa: E402
-from window import WelcomeWindow  # noqa: E402
+from utils import RESOURCE_SCHEME, asset_source, register_resources  # noqa: E402
 
 
 class BigLinuxWelcomeApp(Adw.Application):
-    """Main application."""
+    """Main application.
+
+    Single instance: launching again while an instance runs only asks it to
+    re-present its window. Started with ``--gapplication-service`` (as the
+    D-Bus service file does) it stays resident and hides the window on close,
+    so later activations reuse the window and every page already built.
+    """
 
     def __init__(self) -> None:
         super().__init__(application_id="org.biglinux.welcome")
+        self.win = None
+
+        self.connect("startup", self._on_startup)
+        self.connect("activate", self._on_activate)
 
+    def _on_startup(self, _app: Adw.Application) -> None:
+        # Only runs in the primary instance, not in a launch that forwards
         style_manager = Adw.StyleManager.get_default()
         style_manager.set_color_scheme(Adw.ColorScheme.DEFAULT)
 
-        self.connect("activate", self._on_activate)
+        with tracing.span("register_resources"):
+            register_resources()
         self._load_css()
 
+        if self.is_service:
+            # Stay resident between activations
+            self.hold()
+
+    @property
+    def is_service(self) -> bool:
+        return bool(self.get_flags() & Gio.ApplicationFlags.IS_SERVICE)
+
+    @tracing.traced()
     def _load_css(self) -> None:
         css = Gtk.CssProvider()
-        css_path = os.path.join(APP_PATH, "style.css")
-        css.load_from_path(css_path)
+        source = asset_source("style.css")
+        if source is None:
+            return
+        if source.startswith(RESOURCE_SCHEME):
+            css.load_from_resource(source.removeprefix(RESOURCE_SCHEME))
+        else:
+            css.load_from_path(source)
         display = Gdk.Display.get_default()
         if display:
             Gtk.StyleContext.add_provider_for_display(
@@ -38,5 +65,19 @@ class BigLinuxWelcomeApp(Adw.Application):
             )
 
     def _on_activate(self, _app: Adw.Application) -> None:
-        self.win = WelcomeWindow(self)
-        self.win.present()
+        if self.win is not None:
+            with tracing.span("activate (resident)"):
+                self.win.present()
+            # Lets benchmarks/bench_activation.py see repeat activations
+            tracing.write()
+            return
+
+        # Imported here so a launch that only forwards activation to an
+        # already running instance never loads the window and widgets
+        with tracing.span("import window"):
+            from window import WelcomeWindow
+
+        with tracing.span("activate"):
+            self.win = WelcomeWindow(self)
+            self.win.set_hide_on_close(self.is_service)
+            self.win.present()
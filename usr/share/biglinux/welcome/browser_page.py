@@ -0,0 +1,467 @@
+"""BigLinux Welcome — Default browser page with integrated installation."""
+
+from __future__ import annotations
+
+import gettext
+import os
+import select
+import subprocess
+import threading
+from collections.abc import Callable
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+
+from gi.repository import Adw, Gio, GLib, Gtk  # noqa: E402
+
+import mimeapps  # noqa: E402
+from browsers import (  # noqa: E402
+    Browser,
+    BrowserRegistry,
+    BrowserState,
+    load_default_snapshot,
+    save_default_snapshot,
+)
+from install_output import LineSplitter, new_log_path  # noqa: E402
+from installed import InstalledIndex  # noqa: E402
+from mimeapps import DefaultBrowserResolver  # noqa: E402
+from utils import APP_PATH, browser_icon_source  # noqa: E402
+from widgets import BrowserCard, InstallPanel  # noqa: E402
+from workers import LatestWinsWorker  # noqa: E402
+
+_ = gettext.gettext
+
+
+def _dispatch_lines(lines: list[tuple[str, bool]], panel: InstallPanel) -> None:
+    """Send split lines to the panel as log lines or progress-only lines."""
+    for line, is_newline in lines:
+        if not line or line.startswith("STATUS:"):
+            continue
+        if is_newline:
+            panel.post_log(line)
+        else:
+            panel.post_progress(line)
+
+
+class BrowserPage(Adw.ToastOverlay):
+    """Browser grid that swaps to an InstallPanel while a browser installs.
+
+    Choosing an installed browser marks it as the default right away; the
+    write runs in the background and is rolled back, with a toast, only if
+    it fails.
+    """
+
+    def __init__(self, data: dict, set_nav_sensitive: Callable[[bool], None]) -> None:
+        super().__init__()
+        self._set_nav_sensitive = set_nav_sensitive
+        self.browser_cards: list[BrowserCard] = []
+        self._cards: dict[Browser, BrowserCard] = {}
+        # What the cards currently show, to only touch those that change
+        self._card_states: dict[Browser, BrowserState] = {}
+        self._install_proc: subprocess.Popen[bytes] | None = None
+        self._install_panel: InstallPanel | None = None
+        # Bumped per refresh so only the newest query's answer is applied
+        self._refresh_serial = 0
+        self._refresh_id = 0
+        self._default_browser = DefaultBrowserResolver()
+        self._mimeapps_monitors = self._watch_mimeapps()
+        self.registry = BrowserRegistry(data.get("actions", []))
+        self._installed = InstalledIndex(self.registry.check_paths())
+        self.registry.update_installed(self._installed.exists)
+        # Last default read from the system (or the snapshot, until the first
+        # refresh); the cards show the pending choice instead while it's written
+        self._saved_default = load_default_snapshot()
+        self._pending_default: str | None = None
+        self.registry.default_desktop = self._saved_default
+        self._dirty_dirs: set[str] = set()
+        self._installed_monitors = self._watch_installed()
+        # Default-browser writes: one at a time, a burst only writes the last
+        self._browser_worker = LatestWinsWorker("browser-action", GLib.idle_add)
+
+        scroll = Gtk.ScrolledWindow()
+        scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+
+        main = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=26)
+        main.set_margin_top(28)
+        main.set_margin_bottom(32)
+        main.set_margin_start(40)
+        main.set_margin_end(40)
+        scroll.set_child(main)
+
+        # -- Header (always visible, even during install) --
+        header = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        header.set_halign(Gtk.Align.CENTER)
+        main.append(header)
+
+        title = Gtk.Label(label=_(data.get("title", "")))
+        title.add_css_class("page-title")
+        title.update_property(
+            [Gtk.AccessibleProperty.LABEL], [_(data.get("title", ""))]
+        )
+        header.append(title)
+
+        subtitle = data.get("subtitle", "")
+        if subtitle:
+            sub = Gtk.Label(label=_(subtitle))
+            sub.add_css_class("page-subtitle")
+            sub.set_wrap(True)
+            sub.set_max_width_chars(55)
+            sub.set_justify(Gtk.Justification.CENTER)
+            header.append(sub)
+
+        # -- Inner stack: cards grid ↔ install panel --
+        self.browser_stack = Gtk.Stack()
+        self.browser_stack.set_transition_type(Gtk.StackTransitionType.CROSSFADE)
+        self.browser_stack.set_transition_duration(280)
+        self.browser_stack.set_vexpand(True)
+        main.append(self.browser_stack)
+
+        # Cards grid
+        cards_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
+        cards_container.set_halign(Gtk.Align.CENTER)
+        cards_container.set_valign(Gtk.Align.START)
+
+        browsers = self.registry.browsers
+        items_per_row = 5
+        for i in range(0, len(browsers), items_per_row):
+            row_browsers = browsers[i : i + items_per_row]
+            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=16)
+            row.set_halign(Gtk.Align.CENTER)
+            cards_container.append(row)
+
+            for browser in row_browsers:
+                card = BrowserCard(
+                    browser.entry, self._on_browser_select, browser.installed
+                )
+                card.detected_desktop = browser.desktop
+                card.set_state(browser.installed, self.registry.is_default(browser))
+                self._cards[browser] = card
+                self.browser_cards.append(card)
+                row.append(card)
+
+        self.browser_stack.add_named(cards_container, "browsers")
+        self._card_states = self.registry.states()
+
+        # Install panel placeholder (replaced dynamically)
+        placeholder = Gtk.Box()
+        self.browser_stack.add_named(placeholder, "installing")
+
+        self.set_child(scroll)
+
+        GLib.idle_add(self.refresh_browser_states)
+
+    # ------------------------------------------------------------------
+    # Browser logic
+    # ------------------------------------------------------------------
+
+    def _run_browser_script(self, args: list[str]) -> bool:
+        script_path = os.path.join(APP_PATH, "scripts", "browser.sh")
+        try:
+            cmd = [script_path] + args
+            subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=300)
+            return True
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            print(f"Error running browser script {args}: {e}")
+            return False
+
+    def _set_browser(self, desktop: str) -> bool:
+        """Make ``desktop`` the default browser (may run in a worker thread)."""
+        if mimeapps.needs_script():
+            return self._run_browser_script(["setBrowser", desktop])
+        return mimeapps.set_default_browser(desktop)
+
+    def _watch_mimeapps(self) -> list[Gio.FileMonitor]:
+        monitors = []
+        for path in self._default_browser.paths():
+            try:
+                monitor = Gio.File.new_for_path(path).monitor_file(
+                    Gio.FileMonitorFlags.NONE, None
+                )
+            except GLib.Error:
+                continue
+            monitor.connect("changed", self._on_mimeapps_changed)
+            monitors.append(monitor)
+        return monitors
+
+    def _watch_installed(self) -> list[Gio.FileMonitor]:
+        monitors = []
+        for directory in self._installed.directories():
+            try:
+                monitor = Gio.File.new_for_path(directory).monitor_directory(
+                    Gio.FileMonitorFlags.NONE, None
+                )
+            except GLib.Error:
+                continue
+            monitor.connect("changed", self._on_installed_changed, directory)
+            monitors.append(monitor)
+        return monitors
+
+    def _browser_for(self, card: BrowserCard) -> Browser | None:
+        return self.registry.get(card.browser.get("package", ""))
+
+    def _rescan_installed(self, directories: set[str] | None = None) -> bool:
+        """Relist install directories and update the browsers that changed."""
+        if directories is None:
+            changed = self._installed.rescan_all()
+        else:
+            changed = set()
+            for directory in directories:
+                changed |= self._installed.rescan(directory)
+        browsers = self.registry.browsers_for_checks(changed)
+        self.registry.update_installed(self._installed.exists, browsers)
+        return bool(changed)
+
+    def _on_mimeapps_changed(self, *_args) -> None:
+        self._default_browser.invalidate()
+        self._schedule_refresh()
+
+    def _on_installed_changed(self, *args) -> None:
+        self._dirty_dirs.add(args[-1])
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        # One change emits several events; refresh once for all of them
+        if not self._refresh_id:
+            self._refresh_id = GLib.idle_add(self._on_refresh_idle)
+
+    def _on_refresh_idle(self) -> bool:
+        self._refresh_id = 0
+        dirty, self._dirty_dirs = self._dirty_dirs, set()
+        if dirty and self._rescan_installed(dirty):
+            # The default may name a .desktop file that just appeared
+            self._default_browser.invalidate()
+        return self.refresh_browser_states()
+
+    def refresh_browser_states(self) -> bool:
+        """Update the cards with the installed and default browsers.
+
+        The default comes from the mimeapps.list files (kdeglobals on KDE)
+        when they name one; otherwise ``browser.sh getBrowser`` is run without
+        blocking the main loop and the cards are updated from
+        ``_on_default_browser`` once it exits. Returns SOURCE_REMOVE so it can
+        be used with GLib.idle_add.
+        """
+        self._refresh_serial += 1
+        serial = self._refresh_serial
+        current = self._default_browser.get()
+        if current is not None:
+            self._apply_browser_states(current)
+            return GLib.SOURCE_REMOVE
+
+        script_path = os.path.join(APP_PATH, "scripts", "browser.sh")
+        try:
+            proc = Gio.Subprocess.new(
+                [script_path, "getBrowser"],
+                Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_SILENCE,
+            )
+        except GLib.Error as e:
+            print(f"Error running browser script ['getBrowser']: {e.message}")
+            self._apply_browser_states("")
+            return GLib.SOURCE_REMOVE
+
+        proc.communicate_utf8_async(None, None, self._on_default_browser, serial)
+        return GLib.SOURCE_REMOVE
+
+    def _on_default_browser(
+        self, proc: Gio.Subprocess, result: Gio.AsyncResult, serial: int
+    ) -> None:
+        current = ""
+        try:
+            _ok, stdout, _stderr = proc.communicate_utf8_finish(result)
+            if proc.get_successful():
+                current = (stdout or "").strip()
+        except GLib.Error as e:
+            print(f"Error running browser script ['getBrowser']: {e.message}")
+        if serial != self._refresh_serial:
+            # A newer refresh was started while this one ran
+            return
+        self._apply_browser_states(current)
+
+    def _apply_browser_states(self, current_browser_default: str) -> None:
+        current = current_browser_default or None
+        if current != self._saved_default:
+            self._saved_default = current
+            save_default_snapshot(current)
+        self._sync_cards()
+
+    def _sync_cards(self) -> None:
+        """Show the pending choice, else the system default, on the cards."""
+        self.registry.default_desktop = self._pending_default or self._saved_default
+        changed = self.registry.changed_states(self._card_states)
+        for browser, state in changed.items():
+            card = self._cards[browser]
+            card.detected_desktop = state.desktop
+            card.set_state(state.installed, state.is_default)
+        self._card_states.update(changed)
+
+    def _on_browser_select(self, selected_card: BrowserCard) -> None:
+        browser = self._browser_for(selected_card)
+
+        # If already installed, just set as default (no panel needed)
+        if browser is not None and browser.installed:
+            self._submit_default(browser)
+            return
+
+        # Not installed → show integrated install panel
+        self._start_install(selected_card)
+
+    def _submit_default(self, browser: Browser) -> None:
+        """Show ``browser`` as the default and write it on the browser worker."""
+        self._pending_default = browser.desktop
+        self._sync_cards()
+        self._browser_worker.submit(
+            self._set_default_browser,
+            browser,
+            on_done=lambda ok: self._on_default_browser_set(browser, ok),
+        )
+
+    def _set_default_browser(self, browser: Browser) -> bool:
+        """Set an already-installed browser as default (browser worker)."""
+        desktop = browser.desktop
+        return bool(desktop) and self._set_browser(desktop)
+
+    def _on_default_browser_set(self, browser: Browser, ok: bool) -> None:
+        """Completion of the newest write; earlier ones are never reported."""
+        self._pending_default = None
+        if not ok:
+            # Back to the system default until the refresh below reconciles
+            self._sync_cards()
+            toast = Adw.Toast.new(
+                _("Could not set %s as the default browser") % browser.label
+            )
+            self.add_toast(toast)
+        # Don't wait for the file monitor to notice the write
+        self._on_mimeapps_changed()
+
+    def _start_install(self, card: BrowserCard) -> None:
+        """Show the install panel and start the install process."""
+        browser = card.browser
+        browser_label = browser.get("label", "")
+        package = browser.get("package", "")
+        icon = browser_icon_source(package) if package else None
+
+        # Create and attach the install panel
+        panel = InstallPanel(browser_label, icon, log_path=new_log_path(package))
+        panel.set_done_callback(lambda: self._finish_install(browser_label))
+
+        # Store proc reference for cancel support
+        self._install_proc = None
+        panel.set_cancel_callback(self._cancel_install)
+
+        # Replace the installing page in the stack
+        old = self.browser_stack.get_child_by_name("installing")
+        if old:
+            self.browser_stack.remove(old)
+        self.browser_stack.add_named(panel, "installing")
+        self.browser_stack.set_visible_child_name("installing")
+
+        # Disable navigation during install
+        self._set_nav_sensitive(False)
+
+        # Start pulse animation and background install
+        panel.start_pulse()
+        self._install_panel = panel
+
+        thread = threading.Thread(
+            target=self._perform_browser_install,
+            args=(card, panel),
+            daemon=True,
+        )
+        thread.start()
+
+    def _cancel_install(self) -> None:
+        """Kill the running installation subprocess."""
+        proc = self._install_proc
+        if proc and proc.poll() is None:
+            proc.terminate()
+
+    def _perform_browser_install(self, card: BrowserCard, panel: InstallPanel) -> None:
+        """Run browser installation script, reading output in real time."""
+        browser = card.browser
+        browser_label = browser.get("label", "")
+        package = browser.get("package", "")
+        script_path = os.path.join(APP_PATH, "scripts", "browser.sh")
+
+        success = False
+        try:
+            proc = subprocess.Popen(
+                [script_path, "install", package],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                bufsize=0,
+            )
+            self._install_proc = proc
+
+            if proc.stdout is None:
+                raise OSError("Failed to capture process output")
+
+            self._read_process_output(proc, panel)
+            proc.wait(timeout=600)
+            success = proc.returncode == 0 and not panel.cancelled
+
+        except (OSError, subprocess.TimeoutExpired) as e:
+            panel.post_log(str(e))
+            success = False
+
+        if panel.cancelled:
+            GLib.idle_add(self._finish_install, browser_label)
+            return
+
+        if success:
+            GLib.idle_add(self._post_install_set_default, card)
+            GLib.idle_add(self._finish_install, browser_label)
+        else:
+            GLib.idle_add(panel.set_error, browser_label)
+
+    @staticmethod
+    def _read_process_output(
+        proc: subprocess.Popen[bytes], panel: InstallPanel
+    ) -> None:
+        """Read subprocess output as it arrives, dispatching lines to the panel."""
+        assert proc.stdout is not None
+        splitter = LineSplitter()
+        fd = proc.stdout.fileno()
+        stall_notified = False
+
+        while True:
+            ready, _w, _x = select.select([fd], [], [], 5.0)
+            if not ready:
+                if not stall_notified:
+                    stall_notified = True
+                    panel.post_log(_("Still working…"))
+                continue
+            stall_notified = False
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                line = splitter.flush()
+                if line is not None:
+                    _dispatch_lines([(line, True)], panel)
+                break
+            if panel.cancelled:
+                proc.terminate()
+                break
+            _dispatch_lines(splitter.feed(chunk), panel)
+
+    def _post_install_set_default(self, card: BrowserCard) -> bool:
+        """Set the newly installed browser as default (main loop)."""
+        # Don't wait for the directory monitors to report the new files
+        self._rescan_installed()
+        browser = self._browser_for(card)
+        if browser is not None and browser.desktop:
+            # Through the browser worker, so it is ordered with user choices
+            self._submit_default(browser)
+        return GLib.SOURCE_REMOVE
+
+    def _finish_install(self, _browser_label: str) -> None:
+        """Called when user clicks Done on the install panel."""
+        self._set_nav_sensitive(True)
+        self.browser_stack.set_visible_child_name("browsers")
+        if self._install_panel is not None:
+            self._install_panel.flush_output()
+            self._install_panel.close_log()
+        self._rescan_installed()
+        self._default_browser.invalidate()
+        self.refresh_browser_states()
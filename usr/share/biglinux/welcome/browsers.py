@@ -0,0 +1,210 @@
+"""BigLinux Welcome — Browser registry built from the pages.yaml catalog.
+
+Turns the raw browser page actions into typed entries once, with lookups by
+package, desktop id and check path, and keeps their installed and default
+state. Free of GTK so the browser logic can be tested on its own.
+
+Each catalog check path also stands for the same install under equivalent
+roots (see ``expand_check``), so pages.yaml lists a flatpak once for both
+system and user installations. Paths may start with ``~`` and may use shell
+wildcards in their last component, e.g. ``~/Applications/Firefox*.AppImage``.
+
+The last known default is kept in $XDG_CACHE_HOME/biglinux-welcome so the
+page can show it on first paint, before the real default has been queried.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from xdg_dirs import atomic_write, data_home, user_cache_dir
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_NAME = "browsers.json"
+
+
+def _alternate_roots() -> dict[str, list[str]]:
+    return {
+        # System-wide flatpak → per-user installation (flatpak --user)
+        "/var/lib/flatpak/app": [os.path.join(data_home(), "flatpak", "app")],
+        # Distributions without the /snap symlink (e.g. Arch)
+        "/snap/bin": ["/var/lib/snapd/snap/bin"],
+    }
+
+
+def expand_check(check: str) -> list[str]:
+    """``check`` followed by the same install under any alternate root."""
+    if not check:
+        return [check]
+    path = os.path.normpath(os.path.expanduser(check))
+    directory, name = os.path.split(path)
+    alternates = _alternate_roots().get(directory, [])
+    return [path] + [os.path.join(root, name) for root in alternates]
+
+
+@dataclass(frozen=True)
+class Variant:
+    """One way a browser can be installed (native package, flatpak...)."""
+
+    check: str
+    desktop: str
+
+
+@dataclass(frozen=True)
+class BrowserState:
+    """What a browser card shows."""
+
+    installed: bool
+    desktop: str | None
+    is_default: bool
+
+
+@dataclass(eq=False)
+class Browser:
+    """A browser card's entry and its current state."""
+
+    package: str
+    label: str
+    variants: tuple[Variant, ...]
+    entry: dict = field(repr=False)
+    installed_variant: Variant | None = None
+
+    @property
+    def installed(self) -> bool:
+        return self.installed_variant is not None
+
+    @property
+    def desktop(self) -> str | None:
+        """Desktop id of the installed variant."""
+        variant = self.installed_variant
+        return variant.desktop if variant else None
+
+    @classmethod
+    def from_entry(cls, entry: dict) -> Browser:
+        variants = tuple(
+            Variant(check, v.get("desktop", ""))
+            for v in entry.get("variants", [])
+            if isinstance(v, dict)
+            for check in expand_check(v.get("check", ""))
+        )
+        return cls(
+            package=entry.get("package", ""),
+            label=entry.get("label", ""),
+            variants=variants,
+            entry=entry,
+        )
+
+
+class BrowserRegistry:
+    """All browsers of the catalog with O(1) lookups."""
+
+    def __init__(self, entries: Iterable[dict]) -> None:
+        self.browsers = [Browser.from_entry(entry) for entry in entries]
+        self.default_desktop: str | None = None
+        self._by_package: dict[str, Browser] = {}
+        self._by_desktop: dict[str, Browser] = {}
+        self._by_check: dict[str, tuple[Browser, Variant]] = {}
+        for browser in self.browsers:
+            self._by_package.setdefault(browser.package, browser)
+            for variant in browser.variants:
+                if variant.desktop:
+                    self._by_desktop.setdefault(variant.desktop, browser)
+                if variant.check:
+                    self._by_check.setdefault(variant.check, (browser, variant))
+
+    def __iter__(self):
+        return iter(self.browsers)
+
+    def __len__(self) -> int:
+        return len(self.browsers)
+
+    def get(self, package: str) -> Browser | None:
+        return self._by_package.get(package)
+
+    def for_desktop(self, desktop: str) -> Browser | None:
+        return self._by_desktop.get(desktop)
+
+    def for_check(self, path: str) -> tuple[Browser, Variant] | None:
+        return self._by_check.get(path)
+
+    def check_paths(self) -> list[str]:
+        return list(self._by_check)
+
+    def update_installed(
+        self, exists: Callable[[str], bool], browsers: Iterable[Browser] | None = None
+    ) -> None:
+        """Recompute the installed variant of ``browsers`` (default: all)."""
+        for browser in self.browsers if browsers is None else browsers:
+            browser.installed_variant = next(
+                (v for v in browser.variants if exists(v.check)), None
+            )
+
+    def browsers_for_checks(self, paths: Iterable[str]) -> set[Browser]:
+        """Browsers owning any of the given check paths."""
+        found = set()
+        for path in paths:
+            hit = self._by_check.get(path)
+            if hit is not None:
+                found.add(hit[0])
+        return found
+
+    @property
+    def default(self) -> Browser | None:
+        """The installed browser registered as the system default, if any."""
+        if not self.default_desktop:
+            return None
+        browser = self._by_desktop.get(self.default_desktop)
+        if browser is None or browser.desktop != self.default_desktop:
+            return None
+        return browser
+
+    def is_default(self, browser: Browser) -> bool:
+        return bool(self.default_desktop) and browser.desktop == self.default_desktop
+
+    def state(self, browser: Browser) -> BrowserState:
+        return BrowserState(
+            browser.installed, browser.desktop, self.is_default(browser)
+        )
+
+    def states(self) -> dict[Browser, BrowserState]:
+        return {browser: self.state(browser) for browser in self.browsers}
+
+    def changed_states(
+        self, previous: dict[Browser, BrowserState]
+    ) -> dict[Browser, BrowserState]:
+        """States that differ from ``previous``, e.g. the last ones applied."""
+        changed = {}
+        for browser in self.browsers:
+            state = self.state(browser)
+            if previous.get(browser) != state:
+                changed[browser] = state
+        return changed
+
+
+def load_default_snapshot(path: str | None = None) -> str | None:
+    """Default browser desktop id saved by the last session, if any."""
+    path = path or user_cache_dir(SNAPSHOT_NAME)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        return None
+    default = data.get("default_desktop")
+    return default if isinstance(default, str) and default else None
+
+
+def save_default_snapshot(desktop: str | None, path: str | None = None) -> bool:
+    """Atomically record the default browser; failures are not fatal."""
+    path = path or user_cache_dir(SNAPSHOT_NAME)
+    data = json.dumps({"version": SNAPSHOT_VERSION, "default_desktop": desktop})
+    try:
+        atomic_write(path, data, mode=0o600)
+    except OSError as e:
+        print(f"Error writing browser snapshot {path}: {e}")
+        return False
+    return True
@@ -0,0 +1,135 @@
+"""BigLinux Welcome — pages.yaml loader with a compiled JSON cache.
+
+pages.yaml only changes on package upgrades, so the parsed and validated
+catalog is cached as JSON and reused while the file's mtime and SHA-256
+match. PyYAML is only imported on a cache miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from typing import Any
+
+import tracing
+from xdg_dirs import atomic_write, user_cache_dir
+
+CACHE_VERSION = 1
+CACHE_NAME = "pages.json"
+SYSTEM_CACHE_DIR = "/var/cache/biglinux-welcome"
+
+
+def load_catalog(path: str) -> list[dict] | None:
+    """Load the page catalog from ``path``, using the cache when it is valid."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+    except OSError:
+        return None
+    return load_catalog_data(data, mtime_ns)
+
+
+def load_catalog_data(data: bytes, mtime_ns: int) -> list[dict] | None:
+    """Load the catalog from raw YAML bytes whose source has ``mtime_ns``."""
+    key = _cache_key(data, mtime_ns)
+    for cache_dir in (user_cache_dir(), SYSTEM_CACHE_DIR):
+        pages = _read_cache(os.path.join(cache_dir, CACHE_NAME), key)
+        if pages is not None:
+            return pages
+
+    pages = _parse(data)
+    if pages is not None:
+        _write_cache(os.path.join(user_cache_dir(), CACHE_NAME), key, pages)
+    return pages
+
+
+def validate(data: Any) -> list[dict] | None:
+    """Return the catalog with malformed pages and actions dropped."""
+    if not isinstance(data, list):
+        return None
+    pages = []
+    for page in data:
+        if not isinstance(page, dict):
+            continue
+        actions = page.get("actions", [])
+        if not isinstance(actions, list):
+            actions = []
+        page["actions"] = [a for a in actions if isinstance(a, dict)]
+        pages.append(page)
+    return pages
+
+
+def _cache_key(data: bytes, mtime_ns: int) -> dict[str, Any]:
+    return {
+        "version": CACHE_VERSION,
+        "mtime_ns": mtime_ns,
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+def _parse(data: bytes) -> list[dict] | None:
+    with tracing.span("import yaml"):
+        import yaml
+
+    # The libyaml-backed loader is several times faster when available
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return validate(yaml.load(data, Loader=loader))
+    except yaml.YAMLError:
+        return None
+
+
+def _read_cache(path: str, key: dict[str, Any]) -> list[dict] | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return validate(cached.get("pages"))
+
+
+def _write_cache(path: str, key: dict[str, Any], pages: list[dict]) -> bool:
+    """Atomically write the cache file; failures are not fatal."""
+    data = json.dumps({"key": key, "pages": pages}, ensure_ascii=False)
+    try:
+        atomic_write(path, data)
+    except OSError as e:
+        print(f"Error writing catalog cache {path}: {e}")
+        return False
+    return True
+
+
+def compile_system_cache(path: str, stamp_path: str | None = None) -> bool:
+    """Precompile the catalog into the system-wide cache (run as root).
+
+    ``stamp_path`` supplies the mtime when the app reads pages.yaml from
+    another file, i.e. the welcome.gresource bundle.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+        if stamp_path:
+            mtime_ns = os.stat(stamp_path).st_mtime_ns
+    except OSError as e:
+        print(f"Error reading {path}: {e}")
+        return False
+    pages = _parse(data)
+    if pages is None:
+        print(f"Error parsing {path}")
+        return False
+    cache_path = os.path.join(SYSTEM_CACHE_DIR, CACHE_NAME)
+    return _write_cache(cache_path, _cache_key(data, mtime_ns), pages)
+
+
+if __name__ == "__main__":
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    bundle = os.path.join(app_dir, "welcome.gresource")
+    stamp = bundle if os.path.exists(bundle) else None
+    ok = compile_system_cache(os.path.join(app_dir, "pages.yaml"), stamp)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,173 @@
+"""BigLinux Welcome — Caches of rasterized icons.
+
+Rendering the bundled SVGs (some over 100 KB) is the most expensive part of
+building a page. Decoded textures are shared within the process by
+TextureCache, and the rendered PNGs are kept under
+$XDG_CACHE_HOME/biglinux-welcome/icons by RasterDiskCache for later launches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from xdg_dirs import user_cache_dir
+
+# Bump to drop every entry written by an older renderer
+CACHE_VERSION = 1
+DISK_CACHE_MAX_BYTES = 16 * 1024 * 1024
+DISK_CACHE_MAX_AGE = 30 * 24 * 3600
+MEMORY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+class TextureCache:
+    """In-memory LRU map of decoded textures with a byte cap.
+
+    Keys are (source, size, scale); sizes are the decoded pixel bytes.
+    Only used from the GTK main thread; decode workers hand their results
+    back through GLib.idle_add before they are inserted.
+    """
+
+    def __init__(self, max_bytes: int = MEMORY_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable) -> Any | None:
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        """Insert ``value``, evicting least recently used entries to fit."""
+        if size > self.max_bytes:
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[1]
+        self._items[key] = (value, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _key, (_value, evicted) = self._items.popitem(last=False)
+            self.total_bytes -= evicted
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._items),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class RasterDiskCache:
+    """PNG files keyed by (source, size, scale, mtime) with a size cap.
+
+    Safe to use from the decode worker threads.
+
+    Lookups only stat the file. Recency comes from the later of the write
+    mtime and the kernel-maintained atime, so entries for an older asset mtime
+    (e.g. after a package upgrade), which are never read again, are evicted
+    once unused for ``max_age`` seconds, or least recently used first when
+    the directory grows past ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_bytes: int = DISK_CACHE_MAX_BYTES,
+        max_age: float = DISK_CACHE_MAX_AGE,
+    ) -> None:
+        self.directory = directory or user_cache_dir("icons")
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    @staticmethod
+    def key(source: str, size: int, scale: int, mtime_ns: int) -> str:
+        raw = f"{CACHE_VERSION}\0{source}\0{size}\0{scale}\0{mtime_ns}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def lookup(self, key: str) -> str | None:
+        """Return the cached file for ``key``, if present."""
+        path = self.path(key)
+        return path if os.path.isfile(path) else None
+
+    def store(self, key: str, data: bytes) -> str | None:
+        """Atomically write an entry, then evict if over the size cap."""
+        path = self.path(key)
+        # Unique per thread: several decode workers may store at once
+        tmp = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Error writing icon cache {path}: {e}")
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return None
+        self.evict()
+        return path
+
+    def evict(self) -> None:
+        """Delete stale entries, then least recently used until under the cap."""
+        entries = []
+        total = 0
+        cutoff = time.time_ns() - int(self.max_age * 1e9)
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(".png"):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    used = max(st.st_atime_ns, st.st_mtime_ns)
+                    if used < cutoff:
+                        try:
+                            os.unlink(entry.path)
+                            continue
+                        except OSError:
+                            pass
+                    entries.append((used, st.st_size, entry.path))
+                    total += st.st_size
+        except OSError:
+            return
+
+        entries.sort()
+        for _used, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
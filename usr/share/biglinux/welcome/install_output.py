@@ -0,0 +1,299 @@
+"""BigLinux Welcome — Splitting of installer output into lines.
+
+pacman and yay end ordinary lines with "\\n" and redraw progress lines with
+"\\r". Output arrives in arbitrary chunks from a pipe, so lines are split
+incrementally: each byte is searched once per terminator, and a line that
+never ends is cut at ``max_line`` bytes instead of growing without bound.
+
+:class:`InstallLog` keeps only the most recent lines for the on-screen log
+and streams every line to a per-run file under
+$XDG_CACHE_HOME/biglinux-welcome/logs, so a long AUR build costs the same
+memory as a short one and the full output is still there when it matters.
+
+:class:`LineClassifier` finds a line's progress milestone, log colour tag and
+download progress in one call. Its rules come from install_rules.json, so
+patterns for other tools (yay, flatpak) are data, not code.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from collections import deque
+from collections.abc import Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from xdg_dirs import user_cache_dir
+
+MAX_LINE_BYTES = 64 * 1024
+
+# Lines kept for the on-screen log
+LOG_LINES = 1000
+# Per-run log files kept on disk
+KEEP_LOGS = 5
+
+RULES_NAME = "install_rules.json"
+RULES_VERSION = 1
+
+
+class LineSplitter:
+    """Incremental splitter for "\\n" and "\\r" terminated lines."""
+
+    def __init__(self, max_line: int = MAX_LINE_BYTES) -> None:
+        self.max_line = max_line
+        self._buf = bytearray()
+        # Bytes before this offset are known not to contain a terminator
+        self._scanned = 0
+
+    @property
+    def pending(self) -> bytes:
+        """The incomplete line kept for the next chunk."""
+        return bytes(self._buf)
+
+    def feed(self, chunk: bytes) -> list[tuple[str, bool]]:
+        """Add ``chunk``; return completed lines as (text, ended_by_newline)."""
+        buf = self._buf
+        buf += chunk
+        lines = []
+        start = 0
+        # Next of each terminator; each search resumes after the last hit, so
+        # every byte is examined at most once per terminator (memchr speed)
+        next_n = buf.find(b"\n", self._scanned)
+        next_r = buf.find(b"\r", self._scanned)
+        while next_n >= 0 or next_r >= 0:
+            if next_r < 0 or 0 <= next_n < next_r:
+                end, is_newline = next_n, True
+                next_n = buf.find(b"\n", end + 1)
+            else:
+                end, is_newline = next_r, False
+                next_r = buf.find(b"\r", end + 1)
+            lines.append((self._decode(buf[start:end]), is_newline))
+            start = end + 1
+        # Overlong line: emit it in max_line pieces
+        while len(buf) - start > self.max_line:
+            lines.append((self._decode(buf[start : start + self.max_line]), True))
+            start += self.max_line
+        del buf[:start]
+        self._scanned = len(buf)
+        return lines
+
+    def flush(self) -> str | None:
+        """Return and clear the unterminated remainder, if any."""
+        if not self._buf:
+            return None
+        line = self._decode(self._buf)
+        self._buf.clear()
+        self._scanned = 0
+        return line
+
+    @staticmethod
+    def _decode(data: bytes | bytearray) -> str:
+        return data.decode("utf-8", errors="replace")
+
+
+def new_log_path(name: str, keep: int = KEEP_LOGS) -> str | None:
+    """Path for a new run's log file, pruning all but the newest ``keep``."""
+    directory = user_cache_dir("logs")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with os.scandir(directory) as it:
+            old = sorted(
+                (e for e in it if e.name.endswith(".log") and e.is_file()),
+                key=lambda e: e.stat().st_mtime,
+            )
+        # Make room for the new run
+        for entry in old[: max(0, len(old) - keep + 1)]:
+            os.unlink(entry.path)
+    except OSError as e:
+        print(f"Error preparing install log directory {directory}: {e}")
+        return None
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return os.path.join(directory, f"{name or 'install'}-{stamp}.log")
+
+
+class InstallLog:
+    """The last ``max_lines`` lines in memory, every line in ``path``.
+
+    The file is opened on the first write and reopened if written to after
+    :meth:`close`. If it cannot be written the log keeps working in memory.
+    """
+
+    def __init__(self, max_lines: int = LOG_LINES, path: str | None = None) -> None:
+        self.path = path
+        self.total = 0
+        self._recent: deque[str] = deque(maxlen=max_lines)
+        self._file = None
+
+    @property
+    def max_lines(self) -> int:
+        return self._recent.maxlen or 0
+
+    @property
+    def dropped(self) -> int:
+        """Lines that are only in the file any more."""
+        return self.total - len(self._recent)
+
+    def recent(self) -> list[str]:
+        return list(self._recent)
+
+    def extend(self, lines: Iterable[str]) -> None:
+        lines = list(lines)
+        if not lines:
+            return
+        self.total += len(lines)
+        self._recent.extend(lines)
+        self._spill(lines)
+
+    def flush(self) -> None:
+        """Make everything written so far visible to readers of ``path``."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _spill(self, lines: list[str]) -> None:
+        if self.path is None:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.writelines(line + "\n" for line in lines)
+        except OSError as e:
+            print(f"Error writing install log {self.path}: {e}")
+            self.path = None
+            with suppress(OSError):
+                self.close()
+            self._file = None
+
+
+@dataclass(frozen=True)
+class Milestone:
+    """A phase of the install, reached when its keyword is printed."""
+
+    keyword: str
+    fraction: float
+    label: str
+
+
+class LineClass(NamedTuple):
+    """What one line of installer output means for the install panel.
+
+    A named tuple rather than a dataclass: one is built per line, and frozen
+    dataclasses are several times slower to construct.
+    """
+
+    milestone: Milestone | None = None
+    tag: str | None = None
+    # The line names a package being downloaded (piped pacman output)
+    downloading: bool = False
+    # (speed, percent) from a terminal-style download progress line
+    download: tuple[str, int] | None = None
+
+
+class LineClassifier:
+    """Milestone, log tag and download progress of installer output lines.
+
+    Keywords match case-insensitively anywhere in the line ("contains") or
+    at its first non-blank character ("starts"). Tag rules are in priority
+    order; the first milestone in rule order above the current one wins.
+    Download fields are only filled in during the download phase.
+    """
+
+    def __init__(self, rules: dict) -> None:
+        self.milestones = tuple(
+            Milestone(m["match"].lower(), float(m["fraction"]), m.get("label", ""))
+            for m in rules.get("milestones", [])
+        )
+        self.cancel_cutoff = float(rules.get("cancel_cutoff", 1.0))
+        self._milestone_keys = tuple(
+            (index, m.fraction, m.keyword) for index, m in enumerate(self.milestones)
+        )
+        # Tag rules flattened in priority order: (priority, tag, word) for
+        # "contains", (priority, tag, words) for "starts"
+        self._contains: list[tuple[int, str, str]] = []
+        self._starts: list[tuple[int, str, tuple[str, ...]]] = []
+        for rank, rule in enumerate(rules.get("tags", [])):
+            for word in rule.get("contains", []):
+                self._contains.append((rank, rule["tag"], word.lower()))
+            starts = tuple(word.lower() for word in rule.get("starts", []))
+            if starts:
+                self._starts.append((rank, rule["tag"], starts))
+        # (milestone index, tag) -> result, for lines without download data
+        self._results: dict[tuple[int | None, str | None], LineClass] = {
+            (None, None): LineClass()
+        }
+        download = rules.get("download", {})
+        self.download_phase = tuple(download.get("phase", (0.0, 0.0)))
+        self.download_range = tuple(download.get("range", (0.0, 0.0)))
+        self._marker = download.get("marker", "").lower()
+        speed = download.get("speed")
+        self._speed = re.compile(speed) if speed else None
+        self._percent = re.compile(download.get("percent", r"(\d{1,3})%"))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> LineClassifier:
+        rules = json.loads(data)
+        if not isinstance(rules, dict) or rules.get("version") != RULES_VERSION:
+            raise ValueError("unsupported install rules")
+        return cls(rules)
+
+    def classify(
+        self, line: str, after: float = 0.0, with_tag: bool = True
+    ) -> LineClass:
+        """Classify ``line``; only milestones beyond ``after`` are reported.
+
+        Pass ``with_tag=False`` when the log is not on screen to skip the tag
+        rules.
+        """
+        lower = line.lower()
+        # Plain loops of substring tests: at this number of rules they beat
+        # a combined regex, which is tried at every position of the line
+        milestone = None
+        for index, fraction, keyword in self._milestone_keys:
+            if fraction > after and keyword in lower:
+                milestone = index
+                break
+
+        tag = None
+        if with_tag:
+            for rank, name, word in self._contains:
+                if word in lower:
+                    tag = name
+                    break
+            stripped = lower.lstrip()
+            for start_rank, name, starts in self._starts:
+                # A "starts" rule only wins over a higher priority hit
+                if tag is not None and start_rank >= rank:
+                    break
+                if stripped.startswith(starts):
+                    tag = name
+                    break
+
+        downloading = False
+        download = None
+        phase_start, phase_end = self.download_phase
+        if milestone is None and phase_start <= after < phase_end:
+            downloading = bool(self._marker) and self._marker in lower
+            if not downloading and self._speed is not None:
+                speed = self._speed.search(line)
+                percent = speed and self._percent.search(line, speed.end())
+                if percent:
+                    download = (speed.group(), int(percent.group(1)))
+
+        if downloading or download:
+            return LineClass(None, tag, downloading, download)
+        key = (milestone, tag)
+        result = self._results.get(key)
+        if result is None:
+            result = LineClass(
+                None if milestone is None else self.milestones[milestone], tag
+            )
+            self._results[key] = result
+        return result
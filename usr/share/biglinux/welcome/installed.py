@@ -0,0 +1,87 @@
+"""BigLinux Welcome — Index of which browser check paths exist.
+
+Each directory holding check paths (e.g. /usr/bin, /var/lib/flatpak/app,
+/snap/bin) is listed with one os.scandir instead of calling os.path.exists
+for every variant. The GTK side watches those directories and calls
+:meth:`InstalledIndex.rescan` when one changes, so installs and removals made
+outside the app are picked up live.
+
+The last component of a check path may be a shell wildcard pattern, for
+files whose names carry a version (AppImages); it exists when any entry of
+the directory matches.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from fnmatch import fnmatchcase
+
+
+def _split(path: str) -> tuple[str, str]:
+    return os.path.split(os.path.normpath(path))
+
+
+def _is_pattern(name: str) -> bool:
+    return any(c in name for c in "*?[")
+
+
+class InstalledIndex:
+    """Set of the given check paths that currently exist.
+
+    A rescan replaces a directory's entry instead of mutating it, so lookups
+    from a worker thread never see a half-updated set.
+    """
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        # directory -> entry names we care about in it
+        self._wanted: dict[str, set[str]] = {}
+        for path in paths:
+            if path:
+                directory, name = _split(path)
+                self._wanted.setdefault(directory, set()).add(name)
+        self._present: dict[str, set[str]] = {
+            directory: self._scan(directory) for directory in self._wanted
+        }
+
+    def directories(self) -> list[str]:
+        """Directories to watch for changes."""
+        return list(self._wanted)
+
+    def exists(self, path: str) -> bool:
+        if not path:
+            return False
+        directory, name = _split(path)
+        return name in self._present.get(directory, ())
+
+    def rescan(self, directory: str) -> set[str]:
+        """Relist ``directory``; return the check paths that changed state."""
+        if directory not in self._wanted:
+            return set()
+        present = self._scan(directory)
+        changed = present ^ self._present[directory]
+        self._present[directory] = present
+        return {os.path.join(directory, name) for name in changed}
+
+    def rescan_all(self) -> set[str]:
+        changed: set[str] = set()
+        for directory in self._wanted:
+            changed |= self.rescan(directory)
+        return changed
+
+    def _scan(self, directory: str) -> set[str]:
+        """Names and patterns of ``directory`` that currently match."""
+        wanted = self._wanted[directory]
+        patterns = [name for name in wanted if _is_pattern(name)]
+        found = set()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name in wanted:
+                        found.add(entry.name)
+                    for pattern in patterns:
+                        if fnmatchcase(entry.name, pattern):
+                            found.add(pattern)
+        except OSError:
+            return set()
+        return found
@@ -7,21 +7,36 @@ import gettext
 import locale
 import sys
 
+import tracing
+
+# Must run before GApplication sees argv (it rejects unknown options)
+tracing.configure(sys.argv)
+
 # Internationalization
 DOMAIN = "biglinux-welcome"
 LOCALE_DIR = "/usr/share/locale"
-locale.setlocale(locale.LC_ALL, "")
-locale.bindtextdomain(DOMAIN, LOCALE_DIR)
-gettext.bindtextdomain(DOMAIN, LOCALE_DIR)
-gettext.textdomain(DOMAIN)
+with tracing.span("gettext binding"):
+    locale.setlocale(locale.LC_ALL, "")
+    locale.bindtextdomain(DOMAIN, LOCALE_DIR)
+    gettext.bindtextdomain(DOMAIN, LOCALE_DIR)
+    gettext.textdomain(DOMAIN)
 
-from app import BigLinuxWelcomeApp  # noqa: E402
+with tracing.span("import app"):
+    from app import BigLinuxWelcomeApp  # noqa: E402
 
 
 def main() -> None:
     """Entry point."""
-    app = BigLinuxWelcomeApp()
-    app.run(sys.argv)
+    with tracing.span("BigLinuxWelcomeApp.__init__"):
+        app = BigLinuxWelcomeApp()
+    status = app.run(sys.argv)
+    if tracing.is_enabled():
+        from utils import texture_cache
+
+        tracing.mark("texture cache", **texture_cache.stats())
+        # Rewrite the trace so events after the first frame are included too
+        tracing.write()
+    sys.exit(status)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,268 @@
+"""BigLinux Welcome — Default web browser from the XDG mimeapps.list files.
+
+``xdg-settings get default-web-browser`` forks a shell script that spawns
+several more processes; reading the files directly takes microseconds. The
+lookup follows the freedesktop.org MIME applications associations spec:
+desktop-specific lists before generic ones, user files before system files.
+On KDE the browser set in kdeglobals ([General] BrowserApplication) comes
+first, since that is what KDE itself and xdg-settings use there.
+
+Setting the default is done the same way, in one atomic write, except on
+desktops that keep their own browser setting (see ``needs_script``).
+"""
+
+from __future__ import annotations
+
+import os
+
+from xdg_dirs import (
+    atomic_write,
+    config_dirs,
+    config_home,
+    current_desktops,
+    data_dirs,
+    data_home,
+)
+
+BROWSER_MIME_TYPES = ("x-scheme-handler/http", "x-scheme-handler/https")
+DEFAULT_SECTION = "Default Applications"
+ADDED_SECTION = "Added Associations"
+
+# xdg-settings also updates kdeglobals, helpers.rc or libfm.conf on these
+SCRIPT_DESKTOPS = frozenset({"kde", "xfce", "lxde"})
+
+KDE_GROUP = "General"
+KDE_BROWSER_KEY = "BrowserApplication"
+
+
+def mimeapps_paths() -> list[str]:
+    """All mimeapps.list files in lookup order, whether or not they exist."""
+    directories = [config_home(), *config_dirs(), *application_dirs()]
+    desktops = current_desktops()
+    paths = []
+    for directory in directories:
+        for desktop in desktops:
+            paths.append(os.path.join(directory, f"{desktop}-mimeapps.list"))
+        paths.append(os.path.join(directory, "mimeapps.list"))
+    return paths
+
+
+def application_dirs() -> list[str]:
+    """Directories searched for installed .desktop files."""
+    return [os.path.join(d, "applications") for d in (data_home(), *data_dirs())]
+
+
+def read_section(path: str, section: str) -> dict[str, list[str]]:
+    """Return ``section`` of a mimeapps.list as {mime type: [desktop ids]}."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+    except OSError:
+        return {}
+
+    entries: dict[str, list[str]] = {}
+    current = None
+    for raw in lines:
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            current = line[1:-1].strip()
+            continue
+        if current != section or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        entries[key.strip()] = [v.strip() for v in value.split(";") if v.strip()]
+    return entries
+
+
+def kdeglobals_paths() -> list[str]:
+    """kdeglobals files in lookup order, user file first."""
+    return [os.path.join(d, "kdeglobals") for d in (config_home(), *config_dirs())]
+
+
+def read_value(path: str, group: str, key: str) -> str | None:
+    """Value of ``key`` in ``[group]`` of a KDE-style config file, if set.
+
+    Keys with a flag or locale suffix such as ``BrowserApplication[$e]``
+    count as ``key``.
+    """
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+
+    current = None
+    for raw in lines:
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            current = line[1:-1].strip()
+            continue
+        if current != group or "=" not in line:
+            continue
+        name, value = line.split("=", 1)
+        if name.split("[", 1)[0].strip() == key:
+            return value.strip()
+    return None
+
+
+def kde_browser() -> str | None:
+    """Browser from kdeglobals: a desktop id, "" for a command, None if unset."""
+    for path in kdeglobals_paths():
+        value = read_value(path, KDE_GROUP, KDE_BROWSER_KEY)
+        if not value:
+            continue
+        if value.startswith("!"):
+            # A command line rather than an application; mimeapps.list
+            # can't tell which browser it is
+            return ""
+        return value if value.endswith(".desktop") else f"{value}.desktop"
+    return None
+
+
+def is_installed(desktop_id: str, app_dirs: list[str]) -> bool:
+    return any(os.path.isfile(os.path.join(d, desktop_id)) for d in app_dirs)
+
+
+def query_default(mime_type: str) -> str | None:
+    """First installed default application for ``mime_type``, if any."""
+    app_dirs = application_dirs()
+    for path in mimeapps_paths():
+        for desktop_id in read_section(path, DEFAULT_SECTION).get(mime_type, []):
+            if is_installed(desktop_id, app_dirs):
+                return desktop_id
+    return None
+
+
+class DefaultBrowserResolver:
+    """Default web browser desktop id, cached until :meth:`invalidate`.
+
+    The caller is expected to watch :meth:`paths` and invalidate when any of
+    them changes. ``None`` means the files do not say which browser is the
+    default; callers may fall back to ``xdg-settings`` then.
+    """
+
+    def __init__(self) -> None:
+        self._valid = False
+        self._cached: str | None = None
+
+    def paths(self) -> list[str]:
+        paths = mimeapps_paths()
+        if "kde" in current_desktops():
+            paths += kdeglobals_paths()
+        return paths
+
+    def get(self) -> str | None:
+        if not self._valid:
+            self._cached = self._query()
+            self._valid = True
+        return self._cached
+
+    @staticmethod
+    def _query() -> str | None:
+        if "kde" in current_desktops():
+            browser = kde_browser()
+            if browser is not None:
+                return browser or None
+        # http decides, as in xdg-settings; https is written alongside it
+        return query_default(BROWSER_MIME_TYPES[0])
+
+    def invalidate(self) -> None:
+        self._valid = False
+        self._cached = None
+
+
+def needs_script() -> bool:
+    """Whether the desktop keeps a browser setting outside mimeapps.list."""
+    return any(desktop in SCRIPT_DESKTOPS for desktop in current_desktops())
+
+
+def update_mimeapps(
+    text: str, desktop_id: str, mime_types: tuple[str, ...] = BROWSER_MIME_TYPES
+) -> str:
+    """Return mimeapps.list ``text`` with ``desktop_id`` set for ``mime_types``.
+
+    The application becomes the default and the first added association,
+    as ``xdg-mime default`` does. Other lines are kept unchanged.
+    """
+    sections: list[tuple[str | None, list[str]]] = [(None, [])]
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("[") and stripped.endswith("]"):
+            sections.append((stripped[1:-1].strip(), [line]))
+        else:
+            sections[-1][1].append(line)
+
+    def updated(section: str, mime_type: str, value: str) -> str:
+        if section == DEFAULT_SECTION:
+            return f"{mime_type}={desktop_id}"
+        others = [v.strip() for v in value.split(";") if v.strip()]
+        apps = [desktop_id] + [v for v in others if v != desktop_id]
+        return f"{mime_type}={';'.join(apps)};"
+
+    for target in (DEFAULT_SECTION, ADDED_SECTION):
+        body = next((lines for name, lines in sections if name == target), None)
+        if body is None:
+            last = sections[-1][1]
+            if last and last[-1].strip():
+                last.append("")
+            body = [f"[{target}]"]
+            sections.append((target, body))
+        missing = list(mime_types)
+        for i, line in enumerate(body):
+            key, sep, value = line.partition("=")
+            if sep and key.strip() in missing:
+                missing.remove(key.strip())
+                body[i] = updated(target, key.strip(), value)
+        # New keys go after the section's last entry, before blank lines
+        end = len(body)
+        while end > 1 and not body[end - 1].strip():
+            end -= 1
+        body[end:end] = [updated(target, m, "") for m in missing]
+
+    lines = [line for _name, body in sections for line in body]
+    return "\n".join(lines).strip("\n") + "\n"
+
+
+def write_default(
+    path: str, desktop_id: str, mime_types: tuple[str, ...] = BROWSER_MIME_TYPES
+) -> bool:
+    """Update one mimeapps.list in a single atomic write (temp file + rename).
+
+    A symlinked file is updated where it points, and keeps its permissions.
+    """
+    path = os.path.realpath(path)
+    try:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+    except FileNotFoundError:
+        text = ""
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error reading {path}: {e}")
+        return False
+
+    try:
+        atomic_write(path, update_mimeapps(text, desktop_id, mime_types))
+    except OSError as e:
+        print(f"Error writing {path}: {e}")
+        return False
+    return True
+
+
+def set_default_browser(desktop_id: str) -> bool:
+    """Make ``desktop_id`` the user's default web browser.
+
+    Writes $XDG_CONFIG_HOME/mimeapps.list, plus any desktop-specific user
+    list that already names a browser and would otherwise shadow it.
+    """
+    home = config_home()
+    paths = [os.path.join(home, "mimeapps.list")]
+    for desktop in current_desktops():
+        path = os.path.join(home, f"{desktop}-mimeapps.list")
+        defaults = read_section(path, DEFAULT_SECTION)
+        if any(mime_type in defaults for mime_type in BROWSER_MIME_TYPES):
+            paths.append(path)
+    return all([write_default(path, desktop_id) for path in paths])
@@ -0,0 +1,128 @@
+"""BigLinux Welcome — Opt-in startup tracer with Chrome trace-event output.
+
+Enable with ``--trace[=PATH]`` on the command line or by setting
+``BIGLINUX_WELCOME_TRACE`` to an output path (``1`` picks the default path).
+Open the resulting JSON in ``chrome://tracing`` or https://ui.perfetto.dev.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any, TypeVar
+
+ENV_VAR = "BIGLINUX_WELCOME_TRACE"
+CLI_FLAG = "--trace"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_origin_ns = time.perf_counter_ns()
+_events: list[dict[str, Any]] = []
+_path: str | None = None
+
+
+def default_path() -> str:
+    """Default trace file location (runtime dir, falling back to /tmp)."""
+    base = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(base, f"biglinux-welcome-trace-{os.getpid()}.json")
+
+
+def configure(argv: list[str]) -> None:
+    """Enable tracing from argv or the environment, removing our flag from argv.
+
+    The flag must be stripped before GApplication parses the command line,
+    since it rejects unknown options.
+    """
+    path = os.environ.get(ENV_VAR) or None
+    for arg in list(argv[1:]):
+        if arg == CLI_FLAG:
+            path = path or "1"
+            argv.remove(arg)
+        elif arg.startswith(CLI_FLAG + "="):
+            path = arg.split("=", 1)[1]
+            argv.remove(arg)
+    if path:
+        enable(default_path() if path == "1" else path)
+
+
+def enable(path: str) -> None:
+    global _path
+    _path = path
+
+
+def is_enabled() -> bool:
+    return _path is not None
+
+
+def _now_us() -> float:
+    return (time.perf_counter_ns() - _origin_ns) / 1000
+
+
+def _record(event: dict[str, Any]) -> None:
+    event.setdefault("pid", os.getpid())
+    event.setdefault("tid", threading.get_native_id())
+    _events.append(event)
+
+
+@contextlib.contextmanager
+def span(name: str, **args: Any) -> Iterator[None]:
+    """Record the duration of the enclosed block as a complete ("X") event."""
+    if _path is None:
+        yield
+        return
+    start = _now_us()
+    try:
+        yield
+    finally:
+        event = {"name": name, "ph": "X", "ts": start, "dur": _now_us() - start}
+        if args:
+            event["args"] = args
+        _record(event)
+
+
+def traced(name: str | None = None) -> Callable[[_F], _F]:
+    """Decorator form of :func:`span`, named after the function by default."""
+
+    def decorator(func: _F) -> _F:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*a: Any, **kw: Any) -> Any:
+            if _path is None:
+                return func(*a, **kw)
+            with span(label):
+                return func(*a, **kw)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def mark(name: str, **args: Any) -> None:
+    """Record an instant ("i") event."""
+    if _path is None:
+        return
+    event = {"name": name, "ph": "i", "s": "p", "ts": _now_us()}
+    if args:
+        event["args"] = args
+    _record(event)
+
+
+def write() -> str | None:
+    """Write all recorded events to the trace file and return its path."""
+    if _path is None:
+        return None
+    data = {"traceEvents": list(_events), "displayTimeUnit": "ms"}
+    try:
+        with open(_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError as e:
+        print(f"Error writing trace file {_path}: {e}")
+        return None
+    print(f"Startup trace written to {_path}")
+    return _path
@@ -8,52 +8,255 @@ import platform
 import gi
 
 gi.require_version("Gtk", "4.0")
-gi.require_version("GdkPixbuf", "2.0")
 
-from gi.repository import GdkPixbuf, GLib, Gtk  # noqa: E402
+from gi.repository import Gdk, Gio, GLib, Gtk  # noqa: E402
+
+from icon_cache import RasterDiskCache, TextureCache  # noqa: E402
+from workers import icon_pool  # noqa: E402
 
 APP_PATH = os.path.dirname(os.path.abspath(__file__))
 
+# CSS, pages.yaml, install_rules.json and image/ compiled by generate_gresource.py
+RESOURCE_FILE = os.path.join(APP_PATH, "welcome.gresource")
+RESOURCE_PREFIX = "/org/biglinux/welcome"
+RESOURCE_SCHEME = "resource://"
 
-def load_icon(name: str, size: int = 64, subdir: str = "image") -> Gtk.Image:
-    """Load icon from local file or theme, with accessible name support."""
-    img = None
+_resource: Gio.Resource | None = None
+_resource_mtime_ns = 0
+_disk_cache = RasterDiskCache()
+# Shared by every card, the logo and InstallPanel for the whole session
+texture_cache = TextureCache()
+# Placeholders waiting on an in-flight decode, keyed like texture_cache
+_pending: dict[tuple[str, int, int], list[tuple[Gtk.Image, str]]] = {}
 
-    if name.endswith((".svg", ".png")):
-        path = os.path.join(APP_PATH, subdir, name)
-        if os.path.exists(path):
-            try:
-                pb = GdkPixbuf.Pixbuf.new_from_file_at_size(path, size, size)
-                img = Gtk.Image.new_from_pixbuf(pb)
-            except GLib.Error:
-                pass
 
-    if img is None:
-        img = Gtk.Image.new_from_icon_name(name or "application-x-executable")
+def register_resources() -> bool:
+    """Memory-map the asset bundle; without it assets are read from APP_PATH."""
+    global _resource, _resource_mtime_ns
+    if _resource is None:
+        try:
+            _resource = Gio.Resource.load(RESOURCE_FILE)
+            _resource_mtime_ns = os.stat(RESOURCE_FILE).st_mtime_ns
+        except (GLib.Error, OSError):
+            _resource = None
+            return False
+        Gio.resources_register(_resource)
+    return True
 
-    img.set_pixel_size(size)
-    return img
 
+def asset_source(name: str) -> str | None:
+    """Locate an app asset: a resource URI when bundled, else a file path."""
+    if _resource is not None:
+        path = f"{RESOURCE_PREFIX}/{name}"
+        try:
+            _resource.get_info(path, Gio.ResourceLookupFlags.NONE)
+            return RESOURCE_SCHEME + path
+        except GLib.Error:
+            pass
+    path = os.path.join(APP_PATH, name)
+    return path if os.path.exists(path) else None
 
-def load_browser_icon(package: str, size: int = 64) -> Gtk.Image:
-    """Load browser icon from the browsers folder."""
-    path = os.path.join(APP_PATH, "image", "browsers", f"{package}.svg")
-    img = None
 
-    if os.path.exists(path):
+def read_asset(name: str) -> tuple[bytes, int] | None:
+    """Return an asset's bytes and mtime (the bundle's mtime when bundled)."""
+    if _resource is not None:
+        try:
+            data = _resource.lookup_data(
+                f"{RESOURCE_PREFIX}/{name}", Gio.ResourceLookupFlags.NONE
+            )
+            return data.get_data(), os.stat(RESOURCE_FILE).st_mtime_ns
+        except (GLib.Error, OSError):
+            pass
+    try:
+        with open(os.path.join(APP_PATH, name), "rb") as f:
+            return f.read(), os.fstat(f.fileno()).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _source_mtime_ns(source: str) -> int | None:
+    if source.startswith(RESOURCE_SCHEME):
+        return _resource_mtime_ns
+    try:
+        return os.stat(source).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _rasterize(source: str, size: int):
+    """Decode ``source`` into a GdkPixbuf of at most ``size`` device pixels."""
+    # Imported on first use: pixbuf decoding is not needed for startup
+    gi.require_version("GdkPixbuf", "2.0")
+    from gi.repository import GdkPixbuf
+
+    if source.startswith(RESOURCE_SCHEME):
+        return GdkPixbuf.Pixbuf.new_from_resource_at_scale(
+            source.removeprefix(RESOURCE_SCHEME), size, size, True
+        )
+    return GdkPixbuf.Pixbuf.new_from_file_at_size(source, size, size)
+
+
+def _store_png(key: str, pixbuf) -> None:
+    """Encode and write a disk cache entry (runs in the decode pool)."""
+    try:
+        _ok, data = pixbuf.save_to_bufferv("png", [], [])
+    except GLib.Error as e:
+        print(f"Error encoding icon cache entry: {e}")
+        return
+    _disk_cache.store(key, data)
+
+
+def _texture_nbytes(texture: Gdk.Texture) -> int:
+    return texture.get_width() * texture.get_height() * 4
+
+
+def load_texture(source: str, size: int, scale: int = 1) -> Gdk.Texture | None:
+    """Return ``source`` rendered at ``size`` x ``scale`` device pixels.
+
+    Textures are shared through texture_cache, then the disk cache; only on
+    a miss in both is the image decoded. Raises GLib.Error when it cannot be.
+    """
+    key = (source, size, scale)
+    texture = texture_cache.get(key)
+    if texture is None:
+        texture = _load_texture_uncached(source, size, scale)
+        if texture is not None:
+            texture_cache.put(key, texture, _texture_nbytes(texture))
+    return texture
+
+
+def _load_texture_uncached(source: str, size: int, scale: int) -> Gdk.Texture | None:
+    """Load from the disk cache or decode; safe to call from any thread."""
+    mtime_ns = _source_mtime_ns(source)
+    if mtime_ns is None:
+        return None
+
+    key = _disk_cache.key(source, size, scale, mtime_ns)
+    cached = _disk_cache.lookup(key)
+    if cached:
         try:
-            pb = GdkPixbuf.Pixbuf.new_from_file_at_size(path, size, size)
-            img = Gtk.Image.new_from_pixbuf(pb)
+            return Gdk.Texture.new_from_filename(cached)
         except GLib.Error:
             pass
 
-    if img is None:
-        img = Gtk.Image.new_from_icon_name("web-browser-symbolic")
+    pixbuf = _rasterize(source, size * scale)
+    # Encoding the PNG is not needed for this frame
+    icon_pool().submit(_store_png, key, pixbuf)
+    return Gdk.Texture.new_for_pixbuf(pixbuf)
+
+
+def load_image(source: str | None, size: int, fallback_icon: str) -> Gtk.Image:
+    """Load an image (resource URI or file path) scaled to ``size``.
+
+    The image is rendered for the widget's scale factor and re-rendered when
+    it changes. Falls back to the themed ``fallback_icon`` when the image
+    cannot be loaded.
+    """
+    return _new_image(source, size, fallback_icon, background=False)
+
+
+def load_image_async(source: str | None, size: int, fallback_icon: str) -> Gtk.Image:
+    """Like load_image, but decode in the icon pool behind a placeholder.
+
+    The returned image already has its final size, so page layout does not
+    change when the texture is swapped in.
+    """
+    return _new_image(source, size, fallback_icon, background=True)
+
 
+def _new_image(
+    source: str | None, size: int, fallback_icon: str, background: bool
+) -> Gtk.Image:
+    img = Gtk.Image()
     img.set_pixel_size(size)
+    if not source:
+        img.set_from_icon_name(fallback_icon)
+        return img
+
+    img.set_size_request(size, size)
+    _show_source(img, source, size, fallback_icon, background)
+    img.connect(
+        "notify::scale-factor",
+        lambda w, _pspec: _show_source(w, source, size, fallback_icon, True),
+    )
     return img
 
 
+def _show_source(
+    img: Gtk.Image, source: str, size: int, fallback_icon: str, background: bool
+) -> None:
+    """Show ``source`` at the image's current scale factor."""
+    key = (source, size, img.get_scale_factor())
+    if background:
+        texture = texture_cache.get(key)
+    else:
+        try:
+            texture = load_texture(*key)
+        except GLib.Error:
+            texture = None
+        if texture is None:
+            img.set_from_icon_name(fallback_icon)
+            return
+
+    if texture is not None:
+        img.set_from_paintable(texture)
+        return
+
+    waiters = _pending.get(key)
+    if waiters is not None:
+        waiters.append((img, fallback_icon))
+        return
+
+    _pending[key] = [(img, fallback_icon)]
+    future = icon_pool().submit(_decode_texture, *key)
+    future.add_done_callback(lambda f: GLib.idle_add(_on_texture_decoded, key, f))
+
+
+def _decode_texture(source: str, size: int, scale: int) -> Gdk.Texture | None:
+    try:
+        return _load_texture_uncached(source, size, scale)
+    except GLib.Error:
+        return None
+
+
+def _on_texture_decoded(key: tuple[str, int, int], future) -> bool:
+    error = future.exception()
+    if error is not None:
+        print(f"Error decoding icon {key[0]}: {error}")
+    texture = None if error else future.result()
+    if texture is not None:
+        texture_cache.put(key, texture, _texture_nbytes(texture))
+    for img, fallback_icon in _pending.pop(key, []):
+        # Skip images whose scale changed while this decode was running
+        if img.get_scale_factor() != key[2]:
+            continue
+        if texture is not None:
+            img.set_from_paintable(texture)
+        else:
+            img.set_from_icon_name(fallback_icon)
+    return GLib.SOURCE_REMOVE
+
+
+def load_icon(name: str, size: int = 64, subdir: str = "image") -> Gtk.Image:
+    """Load icon from local file or theme, with accessible name support."""
+    source = None
+    if name.endswith((".svg", ".png")):
+        source = asset_source(f"{subdir}/{name}")
+    return load_image_async(source, size, name or "application-x-executable")
+
+
+def browser_icon_source(package: str) -> str | None:
+    """Locate a browser's icon in the browsers folder."""
+    return asset_source(f"image/browsers/{package}.svg")
+
+
+def load_browser_icon(package: str, size: int = 64) -> Gtk.Image:
+    """Load browser icon from the browsers folder."""
+    return load_image_async(
+        browser_icon_source(package), size, "web-browser-symbolic"
+    )
+
+
 def parse_os_release() -> dict[str, str]:
     """Parse /etc/os-release into a dictionary."""
     try:
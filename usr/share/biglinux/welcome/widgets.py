@@ -5,21 +5,29 @@ from __future__ import annotations
 import gettext
 import math
 import os
-import re
-import shlex
-import subprocess
+import threading
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-gi.require_version("GdkPixbuf", "2.0")
 
-import cairo  # noqa: E402
-from gi.repository import Adw, Gdk, GdkPixbuf, GLib, Gtk  # noqa: E402
+from gi.repository import Adw, Gdk, GLib, Gtk  # noqa: E402
 
-from utils import APP_PATH, load_browser_icon, load_icon  # noqa: E402
+from utils import (  # noqa: E402
+    APP_PATH,
+    load_browser_icon,
+    load_icon,
+    load_image_async,
+    read_asset,
+)
+
+if TYPE_CHECKING:
+    import cairo
+
+    from install_output import LineClass, LineClassifier
 
 _ = gettext.gettext
 
@@ -52,8 +60,10 @@ class AnimatedLogo(Gtk.DrawingArea):
         self.update_property(
             [Gtk.AccessibleProperty.LABEL], ["BigLinux animated logo background"]
         )
-        self.timer_id = GLib.timeout_add(50, self._animate)
-        self.connect("unrealize", lambda _w: self.stop())
+        # Animate only while on screen: a hidden resident window stays idle
+        self.timer_id: int | None = None
+        self.connect("map", lambda _w: self.start())
+        self.connect("unmap", lambda _w: self.stop())
 
     def _animate(self) -> bool:
         self.time += 0.05
@@ -97,6 +107,10 @@ class AnimatedLogo(Gtk.DrawingArea):
             cr.arc(px, py, p["size"], 0, 2 * math.pi)
             cr.fill()
 
+    def start(self) -> None:
+        if not self.timer_id:
+            self.timer_id = GLib.timeout_add(50, self._animate)
+
     def stop(self) -> None:
         if self.timer_id:
             GLib.source_remove(self.timer_id)
@@ -203,6 +217,9 @@ class ActionCard(Gtk.Button):
         content.append(label)
 
     def _on_click(self, _btn: Gtk.Button) -> None:
+        import shlex
+        import subprocess
+
         action_type = self.action.get("type", "")
         command = self.action.get("command", "")
 
@@ -252,12 +269,12 @@ class ActionCard(Gtk.Button):
 class BrowserCard(Gtk.Button):
     """Browser selection card with accessible state announcements."""
 
-    def __init__(self, browser: dict, on_select) -> None:
+    def __init__(self, browser: dict, on_select, installed: bool = False) -> None:
         super().__init__()
         self.browser = browser
         self.on_select = on_select
         self.selected = False
-        self.installed = self._check_installed()
+        self.installed = installed
         self.detected_desktop: str | None = None
 
         self.add_css_class("flat")
@@ -313,13 +330,6 @@ class BrowserCard(Gtk.Button):
         label.set_wrap(True)
         content.append(label)
 
-    def _check_installed(self) -> bool:
-        for variant in self.browser.get("variants", []):
-            check_path = variant.get("check", "")
-            if check_path and os.path.exists(check_path):
-                return True
-        return False
-
     def _update_accessible_name(self) -> None:
         """Build a descriptive accessible name reflecting current state."""
         name = self.browser.get("label", "")
@@ -332,23 +342,34 @@ class BrowserCard(Gtk.Button):
             parts.append(_("default browser"))
         self.update_property([Gtk.AccessibleProperty.LABEL], [", ".join(parts)])
 
-    def set_installed(self, installed: bool) -> None:
-        self.installed = installed
-        if installed:
-            self.remove_css_class("dimmed")
-        else:
-            self.add_css_class("dimmed")
+    def set_state(self, installed: bool, selected: bool) -> None:
+        """Update both flags; untouched when nothing changed.
+
+        Restyling and the accessible-name update (which screen readers
+        announce) only happen for a real change.
+        """
+        if installed == self.installed and selected == self.selected:
+            return
+        if installed != self.installed:
+            self.installed = installed
+            if installed:
+                self.remove_css_class("dimmed")
+            else:
+                self.add_css_class("dimmed")
+        if selected != self.selected:
+            self.selected = selected
+            if selected:
+                self.add_css_class("selected")
+            else:
+                self.remove_css_class("selected")
+            self.check_badge.set_visible(selected)
         self._update_accessible_name()
 
+    def set_installed(self, installed: bool) -> None:
+        self.set_state(installed, self.selected)
+
     def set_selected(self, selected: bool) -> None:
-        self.selected = selected
-        if selected:
-            self.add_css_class("selected")
-            self.check_badge.set_visible(True)
-        else:
-            self.remove_css_class("selected")
-            self.check_badge.set_visible(False)
-        self._update_accessible_name()
+        self.set_state(self.installed, selected)
 
     def set_loading(self, loading: bool) -> None:
         self.spinner.set_visible(loading)
@@ -429,27 +450,33 @@ class InstallPanel(Gtk.Box):
 
     Features a progress bar with real percentage, real-time log viewer,
     cancel button, accessible status announcements, and success/error end-states.
+
+    The installer's reader thread hands lines over with ``post_log`` and
+    ``post_progress``; they are queued and applied in one batch per frame,
+    so a fast installer costs one main-loop dispatch per frame, not per line.
+
+    The log view holds at most ``max_log_lines`` lines (LOG_LINES by default);
+    the complete output goes to ``log_path``, which "Show full log" opens in
+    the text viewer.
     """
 
-    # Milestone-based progress: keyword → fraction
-    # Keywords must match actual pacman piped output (no progress bars, no %)
-    _MILESTONES = [
-        ("synchronizing", 0.05),
-        ("resolving dependencies", 0.10),
-        ("looking for conflicting", 0.15),
-        ("retrieving", 0.20),
-        ("checking key", 0.55),
-        ("checking package integrity", 0.60),
-        ("loading package", 0.65),
-        ("checking for file conflicts", 0.70),
-        ("checking available disk space", 0.75),
-        ("processing package changes", 0.80),
-        ("installing", 0.85),
-        ("upgrading", 0.85),
-        ("running post-transaction hooks", 0.95),
-    ]
-
-    def __init__(self, browser_label: str, browser_icon_path: str | None) -> None:
+    # Interval between batches of queued output (about one frame)
+    _DRAIN_INTERVAL_MS = 16
+
+    # Progress milestones, log tags and download patterns, loaded on first use
+    _classifier: LineClassifier | None = None
+
+    def __init__(
+        self,
+        browser_label: str,
+        browser_icon: str | None,
+        log_path: str | None = None,
+        max_log_lines: int | None = None,
+    ) -> None:
+        # Imported on first use: the install machinery is not needed for the
+        # first frame
+        from install_output import LOG_LINES, InstallLog
+
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         self.set_halign(Gtk.Align.FILL)
         self.set_valign(Gtk.Align.CENTER)
@@ -459,6 +486,15 @@ class InstallPanel(Gtk.Box):
         self._cancel_callback: Callable[[], None] | None = None
         self._last_milestone = 0.0
         self._cancelled = False
+        # (is_log_line, text) pairs posted by the reader thread
+        self._queue: list[tuple[bool, str]] = []
+        self._queue_lock = threading.Lock()
+        self._drain_pending = False
+        if max_log_lines is None:
+            max_log_lines = LOG_LINES
+        self._log = InstallLog(max_log_lines, log_path)
+        # The view lags the log while the details are collapsed
+        self._log_view_stale = False
 
         # -- Outer card --
         card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
@@ -469,19 +505,7 @@ class InstallPanel(Gtk.Box):
         self.append(card)
 
         # -- Large centered icon --
-        icon_size = 64
-        if browser_icon_path and os.path.exists(browser_icon_path):
-            try:
-                pb = GdkPixbuf.Pixbuf.new_from_file_at_size(
-                    browser_icon_path, icon_size, icon_size
-                )
-                icon = Gtk.Image.new_from_pixbuf(pb)
-            except GLib.Error:
-                icon = Gtk.Image.new_from_icon_name("web-browser-symbolic")
-        else:
-            icon = Gtk.Image.new_from_icon_name("web-browser-symbolic")
-
-        icon.set_pixel_size(icon_size)
+        icon = load_image_async(browser_icon, 64, "web-browser-symbolic")
         icon.set_halign(Gtk.Align.CENTER)
         card.append(icon)
 
@@ -534,6 +558,7 @@ class InstallPanel(Gtk.Box):
         self._revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_DOWN)
         self._revealer.set_transition_duration(250)
         self._revealer.set_reveal_child(False)
+        self._revealer.connect("notify::reveal-child", self._on_reveal_changed)
         card.append(self._revealer)
 
         log_frame = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -559,6 +584,18 @@ class InstallPanel(Gtk.Box):
         log_scroll.set_child(self._log_view)
         self._log_buffer = self._log_view.get_buffer()
 
+        self._full_log_btn = Gtk.Button(label=_("Show full log"))
+        self._full_log_btn.add_css_class("flat")
+        self._full_log_btn.add_css_class("install-detail-toggle")
+        self._full_log_btn.set_halign(Gtk.Align.END)
+        self._full_log_btn.set_visible(log_path is not None)
+        self._full_log_btn.update_property(
+            [Gtk.AccessibleProperty.LABEL],
+            [_("Open the complete installation log")],
+        )
+        self._full_log_btn.connect("clicked", self._on_show_full_log)
+        log_frame.append(self._full_log_btn)
+
         # Color tags for log lines
         self._log_buffer.create_tag("error", foreground="#f66151")
         self._log_buffer.create_tag("success", foreground="#57e389")
@@ -614,39 +651,96 @@ class InstallPanel(Gtk.Box):
     def cancelled(self) -> bool:
         return self._cancelled
 
+    def post_log(self, line: str) -> None:
+        """Queue a log line from any thread; it is shown with the next batch."""
+        self._post(True, line)
+
+    def post_progress(self, line: str) -> None:
+        """Queue a progress-only line (ended by a carriage return)."""
+        self._post(False, line)
+
     def append_log(self, line: str) -> None:
         """Append a line to the log viewer, auto-scroll, and parse progress."""
-        end_iter = self._log_buffer.get_end_iter()
-        tag_name = self._get_line_tag(line)
-        if tag_name:
-            tag = self._log_buffer.get_tag_table().lookup(tag_name)
-            self._log_buffer.insert_with_tags(end_iter, line + "\n", tag)
+        result = self._rules().classify(line, self._last_milestone)
+        self.append_lines([line], [result.tag])
+        self._parse_progress(line, result)
+
+    def append_lines(
+        self, lines: list[str], tags: list[str | None] | None = None
+    ) -> None:
+        """Record lines in the log; show them if the log is revealed.
+
+        While the details are collapsed (the default) the lines only go to
+        the log model, and the view is filled in one insert when revealed.
+        ``tags`` are the lines' colour tags when already classified.
+        """
+        if not lines:
+            return
+        self._log.extend(lines)
+        if self._revealer.get_reveal_child():
+            keep = self._log.max_lines
+            self._render_lines(lines[-keep:], tags[-keep:] if tags else None)
         else:
-            self._log_buffer.insert(end_iter, line + "\n")
+            self._log_view_stale = True
+
+    def _render_lines(
+        self, lines: list[str], tags: list[str | None] | None = None
+    ) -> None:
+        """Append lines to the log viewer with one insert, then auto-scroll.
+
+        Lines beyond the view's limit are dropped from its start; they stay
+        in the log file.
+        """
+        if tags is None:
+            tags = [self._get_line_tag(line) for line in lines]
+        max_lines = self._log.max_lines
+        buf = self._log_buffer
+        start_offset = buf.get_char_count()
+        buf.insert(buf.get_end_iter(), "".join(line + "\n" for line in lines))
+
+        tag_table = buf.get_tag_table()
+        offset = start_offset
+        for line, tag_name in zip(lines, tags):
+            length = len(line) + 1
+            if tag_name:
+                buf.apply_tag(
+                    tag_table.lookup(tag_name),
+                    buf.get_iter_at_offset(offset),
+                    buf.get_iter_at_offset(offset + length),
+                )
+            offset += length
+
+        # The buffer ends with a newline, so its last line is empty
+        excess = buf.get_line_count() - 1 - max_lines
+        if excess > 0:
+            _found, cut = buf.get_iter_at_line(excess)
+            buf.delete(buf.get_start_iter(), cut)
+
         # Auto-scroll
-        end_mark = self._log_buffer.create_mark(
-            None, self._log_buffer.get_end_iter(), False
-        )
+        end_mark = buf.create_mark(None, buf.get_end_iter(), False)
         self._log_view.scroll_mark_onscreen(end_mark)
-        self._log_buffer.delete_mark(end_mark)
-        # Parse progress
-        self._parse_progress(line)
+        buf.delete_mark(end_mark)
 
-    @staticmethod
-    def _get_line_tag(line: str) -> str | None:
+    @classmethod
+    def _rules(cls) -> LineClassifier:
+        """Classifier built from install_rules.json (empty if unreadable)."""
+        if cls._classifier is None:
+            from install_output import RULES_NAME, LineClassifier
+
+            asset = read_asset(RULES_NAME)
+            try:
+                if asset is None:
+                    raise OSError("not found")
+                cls._classifier = LineClassifier.from_json(asset[0])
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Error loading {RULES_NAME}: {e}")
+                cls._classifier = LineClassifier({})
+        return cls._classifier
+
+    @classmethod
+    def _get_line_tag(cls, line: str) -> str | None:
         """Return a color tag name based on the line content."""
-        lower = line.lower().strip()
-        if "error" in lower or "failed" in lower:
-            return "error"
-        if "successfully" in lower or "done" in lower:
-            return "success"
-        if "warning" in lower:
-            return "warning"
-        if lower.startswith(("installing", "removing", "checking", "resolving", "::")):
-            return "info"
-        if lower.startswith(("package", "total", "optional")):
-            return "dim"
-        return None
+        return cls._rules().classify(line).tag
 
     def parse_progress(self, line: str) -> None:
         """Public interface: parse progress without adding to log."""
@@ -663,6 +757,7 @@ class InstallPanel(Gtk.Box):
 
     def set_success(self, browser_label: str) -> None:
         """Show success state."""
+        self.flush_output()
         self.stop_pulse()
         self.set_progress(1.0, _("It has been set as your default browser."))
         self._title.set_label(_("%s installed successfully!") % browser_label)
@@ -675,9 +770,11 @@ class InstallPanel(Gtk.Box):
             [Gtk.AccessibleProperty.LABEL],
             [_("%s installed successfully") % browser_label],
         )
+        self.close_log()
 
     def set_error(self, browser_label: str) -> None:
         """Show error state."""
+        self.flush_output()
         self.stop_pulse()
         self._progress.set_visible(False)
         self._percent_label.set_visible(False)
@@ -693,6 +790,15 @@ class InstallPanel(Gtk.Box):
             [Gtk.AccessibleProperty.LABEL],
             [_("Installation of %s failed") % browser_label],
         )
+        self.close_log()
+
+    def close_log(self) -> None:
+        """Close the log file; it is reopened if more output arrives."""
+        self._log.close()
+
+    def flush_output(self) -> None:
+        """Apply queued output now, so end states are not overwritten by it."""
+        self._drain_queue()
 
     def set_done_callback(self, callback: Callable[[], None]) -> None:
         self._done_callback = callback
@@ -702,82 +808,84 @@ class InstallPanel(Gtk.Box):
 
     # -- Internal --
 
-    # Use untranslated strings at class level; translate at lookup time
-    _PHASE_LABELS = {
-        "synchronizing": "Synchronizing databases…",
-        "resolving dependencies": "Resolving dependencies…",
-        "looking for conflicting": "Checking for conflicts…",
-        "retrieving": "Downloading packages…",
-        "checking key": "Verifying signatures…",
-        "checking package integrity": "Verifying integrity…",
-        "loading package": "Loading packages…",
-        "checking for file conflicts": "Checking for conflicts…",
-        "checking available disk space": "Checking disk space…",
-        "processing package changes": "Applying changes…",
-        "installing": "Installing…",
-        "upgrading": "Upgrading…",
-        "running post-transaction hooks": "Running post-install hooks…",
-    }
-
-    # Cancel is disabled once filesystem changes begin
-    _CANCEL_CUTOFF = 0.80  # "processing package changes"
-
-    # Regex for download progress lines:
-    # " firefox-138.0.4-1  45.2 MiB  12.5 MiB/s 00:03 [###] 58%"
-    _RE_DOWNLOAD = re.compile(r"(\d+(?:\.\d+)?\s*[KMG]iB/s).*?(\d{1,3})%")
-
-    def _parse_progress(self, line: str) -> None:
-        """Parse pacman/yay output using milestone keywords."""
-        lower = line.lower()
-
-        # Check milestone keywords first
-        matched_milestone = False
-        for keyword, fraction in self._MILESTONES:
-            if keyword in lower and fraction > self._last_milestone:
-                self._last_milestone = fraction
-                self.stop_pulse()
-                self._progress.set_fraction(fraction)
-                self._percent_label.set_label(f"{int(fraction * 100)}%")
-                label = self._PHASE_LABELS.get(keyword, "")
-                if label:
-                    self._subtitle.set_label(_(label))
-                    # Announce progress to screen readers at each milestone
-                    pct = int(fraction * 100)
-                    self.update_property(
-                        [Gtk.AccessibleProperty.LABEL],
-                        [f"{_(label)} {pct}%"],
-                    )
-                matched_milestone = True
-
-                # Disable cancel once real installation begins
-                if fraction >= self._CANCEL_CUTOFF:
-                    self._cancel_btn.set_sensitive(False)
-                    self._cancel_btn.set_tooltip_text(
-                        _("Cannot cancel during installation")
-                    )
-
-                break
+    def _post(self, is_log: bool, line: str) -> None:
+        with self._queue_lock:
+            self._queue.append((is_log, line))
+            if self._drain_pending:
+                return
+            self._drain_pending = True
+        GLib.timeout_add(self._DRAIN_INTERVAL_MS, self._drain_queue)
+
+    def _drain_queue(self) -> bool:
+        """Apply everything posted since the last batch."""
+        with self._queue_lock:
+            batch, self._queue = self._queue, []
+            self._drain_pending = False
+        rules = self._rules()
+        # Tags are only needed while the log is on screen
+        revealed = self._revealer.get_reveal_child()
+        lines: list[str] = []
+        tags: list[str | None] = []
+        for is_log, line in batch:
+            result = rules.classify(line, self._last_milestone, revealed)
+            self._parse_progress(line, result)
+            if is_log:
+                lines.append(line)
+                tags.append(result.tag)
+        self.append_lines(lines, tags)
+        return GLib.SOURCE_REMOVE
+
+    def _parse_progress(self, line: str, result: LineClass | None = None) -> None:
+        """Update progress from pacman/yay output; ``result`` if classified."""
+        rules = self._rules()
+        if result is None:
+            result = rules.classify(line, self._last_milestone)
+
+        milestone = result.milestone
+        if milestone is not None:
+            fraction = milestone.fraction
+            self._last_milestone = fraction
+            self.stop_pulse()
+            self._progress.set_fraction(fraction)
+            self._percent_label.set_label(f"{int(fraction * 100)}%")
+            label = milestone.label
+            if label:
+                self._subtitle.set_label(_(label))
+                # Announce progress to screen readers at each milestone
+                pct = int(fraction * 100)
+                self.update_property(
+                    [Gtk.AccessibleProperty.LABEL],
+                    [f"{_(label)} {pct}%"],
+                )
+
+            # Disable cancel once real installation begins
+            if fraction >= rules.cancel_cutoff:
+                self._cancel_btn.set_sensitive(False)
+                self._cancel_btn.set_tooltip_text(
+                    _("Cannot cancel during installation")
+                )
+            return
 
         # During download phase, update subtitle with package name or speed info
-        if not matched_milestone and 0.05 <= self._last_milestone < 0.55:
-            # Show what's being downloaded (piped output: "chromium ... downloading...")
-            if "downloading" in lower:
-                name = line.strip().replace("downloading...", "").strip()
-                if name:
-                    self._subtitle.set_label(_("Downloading {name}…").format(name=name))
-            # If terminal-mode output with speed (rare for piped pacman)
-            else:
-                dl_match = self._RE_DOWNLOAD.search(line)
-                if dl_match:
-                    speed = dl_match.group(1)
-                    pct = int(dl_match.group(2))
-                    fraction = 0.20 + (pct / 100.0) * 0.35
-                    self.stop_pulse()
-                    self._progress.set_fraction(fraction)
-                    self._percent_label.set_label(f"{int(fraction * 100)}%")
-                    self._subtitle.set_label(
-                        _("Downloading… {pct}% ({speed})").format(pct=pct, speed=speed)
-                    )
+        phase_start, phase_end = rules.download_phase
+        if not phase_start <= self._last_milestone < phase_end:
+            return
+        # Show what's being downloaded (piped output: "chromium ... downloading...")
+        if result.downloading:
+            name = line.strip().replace("downloading...", "").strip()
+            if name:
+                self._subtitle.set_label(_("Downloading {name}…").format(name=name))
+        # If terminal-mode output with speed (rare for piped pacman)
+        elif result.download is not None:
+            speed, pct = result.download
+            low, high = rules.download_range
+            fraction = low + (pct / 100.0) * (high - low)
+            self.stop_pulse()
+            self._progress.set_fraction(fraction)
+            self._percent_label.set_label(f"{int(fraction * 100)}%")
+            self._subtitle.set_label(
+                _("Downloading… {pct}% ({speed})").format(pct=pct, speed=speed)
+            )
 
     def _do_pulse(self) -> bool:
         self._progress.pulse()
@@ -796,6 +904,24 @@ class InstallPanel(Gtk.Box):
             ],
         )
 
+    def _on_reveal_changed(self, revealer: Gtk.Revealer, _pspec) -> None:
+        if revealer.get_reveal_child() and self._log_view_stale:
+            self._log_view_stale = False
+            self._log_buffer.set_text("")
+            self._render_lines(self._log.recent())
+
+    def _on_show_full_log(self, _btn: Gtk.Button) -> None:
+        path = self._log.path
+        if path is None:
+            return
+        self._log.flush()
+        root = self.get_root()
+        Gtk.show_uri(
+            root if isinstance(root, Gtk.Window) else None,
+            GLib.filename_to_uri(path, None),
+            Gdk.CURRENT_TIME,
+        )
+
     def _on_cancel(self, _btn: Gtk.Button) -> None:
         self._cancelled = True
         self._cancel_btn.set_sensitive(False)
@@ -806,5 +932,6 @@ class InstallPanel(Gtk.Box):
 
     def _on_done(self, _btn: Gtk.Button) -> None:
         self.stop_pulse()
+        self.close_log()
         if self._done_callback:
             self._done_callback()
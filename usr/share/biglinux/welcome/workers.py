@@ -0,0 +1,101 @@
+"""BigLinux Welcome — Background worker pools."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+    # (generation, func, args, on_done)
+    _Job = tuple[int, Callable[..., Any], tuple, Callable[[Any], Any] | None]
+
+_icon_pool: ThreadPoolExecutor | None = None
+
+
+def icon_pool() -> ThreadPoolExecutor:
+    """Small shared pool that decodes icons off the GTK main thread."""
+    global _icon_pool
+    if _icon_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+        _icon_pool = ThreadPoolExecutor(workers, thread_name_prefix="icon-decode")
+    return _icon_pool
+
+
+class LatestWinsWorker:
+    """Single background thread where only the newest request matters.
+
+    Jobs run one at a time. A job submitted while another runs replaces any
+    job still waiting, so a burst of submissions runs the first and the
+    last only. ``on_done`` is called for the newest job alone; completions
+    of superseded jobs are dropped. Completions are passed to ``dispatch``
+    (e.g. GLib.idle_add) and checked again there, so a submission made
+    after a job finished but before its callback ran also supersedes it.
+    """
+
+    def __init__(self, name: str, dispatch: Callable[..., Any] | None = None) -> None:
+        self._name = name
+        self._dispatch = dispatch or (lambda func, *args: func(*args))
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._pending: _Job | None = None
+        self._running = False
+        self._pool: ThreadPoolExecutor | None = None
+
+    @property
+    def generation(self) -> int:
+        """Number of the newest submission."""
+        return self._generation
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        on_done: Callable[[Any], Any] | None = None,
+    ) -> int:
+        """Queue ``func(*args)``, superseding every earlier submission."""
+        with self._lock:
+            self._generation += 1
+            self._pending = (self._generation, func, args, on_done)
+            start = not self._running
+            self._running = True
+            generation = self._generation
+        if start:
+            self._executor().submit(self._drain)
+        return generation
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._pool = ThreadPoolExecutor(1, thread_name_prefix=self._name)
+        return self._pool
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                job = self._pending
+                self._pending = None
+                if job is None:
+                    self._running = False
+                    return
+            generation, func, args, on_done = job
+            try:
+                result = func(*args)
+            except Exception as e:
+                print(f"Error in {self._name} worker: {e}")
+                result = None
+            if on_done is not None and generation == self._generation:
+                self._dispatch(self._complete, generation, on_done, result)
+
+    def _complete(
+        self, generation: int, on_done: Callable[[Any], Any], result: Any
+    ) -> bool:
+        if generation == self._generation:
+            on_done(result)
+        return False
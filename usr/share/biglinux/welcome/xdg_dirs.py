@@ -0,0 +1,74 @@
+"""BigLinux Welcome — XDG base directory helpers."""
+
+from __future__ import annotations
+
+import os
+import stat
+
+APP_NAME = "biglinux-welcome"
+
+
+def cache_home() -> str:
+    """$XDG_CACHE_HOME, defaulting to ~/.cache."""
+    return os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+
+def user_cache_dir(*parts: str) -> str:
+    """Per-user cache directory ($XDG_CACHE_HOME/biglinux-welcome/...)."""
+    return os.path.join(cache_home(), APP_NAME, *parts)
+
+
+def config_home() -> str:
+    """$XDG_CONFIG_HOME, defaulting to ~/.config."""
+    return os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+
+
+def config_dirs() -> list[str]:
+    """$XDG_CONFIG_DIRS, defaulting to /etc/xdg."""
+    return _path_list("XDG_CONFIG_DIRS", "/etc/xdg")
+
+
+def data_home() -> str:
+    """$XDG_DATA_HOME, defaulting to ~/.local/share."""
+    return os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+
+
+def data_dirs() -> list[str]:
+    """$XDG_DATA_DIRS, defaulting to /usr/local/share and /usr/share."""
+    return _path_list("XDG_DATA_DIRS", "/usr/local/share:/usr/share")
+
+
+def current_desktops() -> list[str]:
+    """Lowercased $XDG_CURRENT_DESKTOP entries, most specific first."""
+    value = os.environ.get("XDG_CURRENT_DESKTOP", "")
+    return [name.lower() for name in value.split(":") if name]
+
+
+def atomic_write(path: str, data: str, mode: int = 0o644) -> None:
+    """Replace ``path`` with ``data`` via a temp file and rename; raises OSError.
+
+    Symlinks are followed so their target is replaced, and an existing file
+    keeps its permissions; ``mode`` only applies to new files.
+    """
+    path = os.path.realpath(path)
+    directory, name = os.path.split(path)
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        pass
+    tmp = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+            os.fchmod(f.fileno(), mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _path_list(var: str, default: str) -> list[str]:
+    value = os.environ.get(var) or default
+    return [path for path in value.split(":") if path]